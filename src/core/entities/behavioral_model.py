@@ -6,6 +6,7 @@ extracted through AST analysis, control flow graphs, and data flow analysis.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -41,7 +42,7 @@ class NodeType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ASTNode:
     """Represents a node in the Abstract Syntax Tree.
 
@@ -63,6 +64,16 @@ class ASTNode:
     line_number: int | None = None
     column: int | None = None
 
+    def __post_init__(self) -> None:
+        """Intern the node name.
+
+        The same variable and call names repeat throughout a tree, so
+        interning lets name comparisons in the analysis passes short-circuit
+        on identity.
+        """
+        if type(self.name) is str:
+            object.__setattr__(self, "name", sys.intern(self.name))
+
     def to_dict(self) -> dict[str, Any]:
         """Convert AST node to dictionary representation."""
         result: dict[str, Any] = {"type": self.node_type.value}
@@ -83,7 +94,7 @@ class ASTNode:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CFGNode:
     """Represents a node in the Control Flow Graph.
 
@@ -104,7 +115,7 @@ class CFGNode:
     is_exit: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CFGEdge:
     """Represents an edge in the Control Flow Graph.
 
@@ -121,7 +132,7 @@ class CFGEdge:
     edge_type: str = "normal"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ControlFlowGraph:
     """Represents the Control Flow Graph of a code unit.
 
@@ -164,7 +175,7 @@ class ControlFlowGraph:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataFlowInfo:
     """Contains data flow analysis results.
 
@@ -199,7 +210,7 @@ class DataFlowInfo:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BehavioralModel:
     """Represents the extracted behavioral model from source code.
 
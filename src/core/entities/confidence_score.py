@@ -26,7 +26,7 @@ class EvidenceType(str, Enum):
     INFERENCE = "inference"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvidenceItem:
     """A single piece of evidence supporting a finding.
 
@@ -60,7 +60,7 @@ class EvidenceItem:
         return self.strength >= 0.7
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfidenceBreakdown:
     """Breakdown of confidence score components.
 
@@ -110,7 +110,7 @@ class ConfidenceBreakdown:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfidenceScore:
     """Complete confidence score for a verification finding.
 
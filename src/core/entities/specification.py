@@ -40,7 +40,7 @@ class RequirementType(str, Enum):
     POSTCONDITION = "postcondition"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpecificationMetadata:
     """Metadata for a specification document.
 
@@ -75,7 +75,7 @@ class SpecificationMetadata:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpecificationChunk:
     """A semantic chunk of specification text.
 
@@ -110,7 +110,7 @@ class SpecificationChunk:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpecificationDocument:
     """Represents a complete specification document.
 
@@ -141,7 +141,7 @@ class SpecificationDocument:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Requirement:
     """A normalized requirement extracted from specifications.
 
@@ -173,7 +173,7 @@ class Requirement:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Constraint:
     """A constraint extracted from specifications.
 
@@ -202,7 +202,7 @@ class Constraint:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Invariant:
     """An invariant extracted from specifications.
 
@@ -228,7 +228,7 @@ class Invariant:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EdgeCase:
     """An edge case extracted from specifications.
 
@@ -257,7 +257,7 @@ class EdgeCase:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TraceabilityHint:
     """A hint for tracing between spec and implementation.
 
@@ -283,7 +283,7 @@ class TraceabilityHint:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedSpecification:
     """The normalized specification output from Layer 2.
 
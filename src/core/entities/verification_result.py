@@ -47,7 +47,7 @@ class FindingCategory(str, Enum):
     OTHER = "other"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     """Represents a single compliance finding.
 
@@ -106,7 +106,7 @@ class Finding:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VerificationSummary:
     """Summary of verification results.
 
@@ -141,7 +141,7 @@ class VerificationSummary:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Metrics:
     """Verification metrics.
 
@@ -173,7 +173,7 @@ class Metrics:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VerificationDecision:
     """Final CI/CD decision based on verification results.
 
@@ -199,7 +199,7 @@ class VerificationDecision:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VerificationResult:
     """Complete verification result from Layer 3.
 
@@ -230,14 +230,19 @@ class VerificationResult:
     specifications_used: tuple[str, ...] = field(default_factory=tuple)
     raw_cot_output: str | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert verification result to dictionary representation."""
+    def to_dict(self, *, include_findings: bool = True) -> dict[str, Any]:
+        """Convert verification result to dictionary representation.
+
+        Args:
+            include_findings: Whether to serialize the findings; when False
+                the "findings" key keeps its position with an empty list
+        """
         return {
             "run_id": self.run_id,
             "timestamp": self.timestamp.isoformat(),
             "fork": self.fork,
             "summary": self.summary.to_dict(),
-            "findings": [f.to_dict() for f in self.findings],
+            "findings": [f.to_dict() for f in self.findings] if include_findings else [],
             "metrics": self.metrics.to_dict(),
             "decision": self.decision.to_dict(),
             "behavioral_models_checked": list(self.behavioral_models_checked),
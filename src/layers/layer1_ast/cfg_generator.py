@@ -15,8 +15,11 @@ from src.core.entities.behavioral_model import (
     ControlFlowGraph,
     NodeType,
 )
+from src.shared.utils.cache import IdentityCache
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.core.entities.behavioral_model import ASTNode
 
 
@@ -33,9 +36,46 @@ class CFGGenerator:
         self._edges: list[CFGEdge] = []
         self._node_counter = 0
 
+        # Node-type specific processors; other nodes are plain statements
+        self._processors: dict[NodeType, Callable[[ASTNode, str], list[str]]] = {
+            NodeType.MODULE: self._process_module,
+            NodeType.FUNCTION: self._process_function,
+            NodeType.IF: self._process_if,
+            NodeType.FOR: self._process_for,
+            NodeType.WHILE: self._process_while,
+            NodeType.TRY: self._process_try,
+            NodeType.RETURN: self._process_return,
+        }
+
+        # Generated CFGs keyed by AST identity
+        self._cache: IdentityCache[ASTNode, ControlFlowGraph] = IdentityCache()
+
     def generate(self, ast: ASTNode) -> ControlFlowGraph:
         """Generate a CFG from an AST.
 
+        Results are cached per AST object, so repeated calls with the same
+        AST return the previously generated graph. ASTNode is frozen except
+        for its ``metadata`` dict; callers must not mutate an AST (metadata
+        included) after passing it here, or the cached graph goes stale.
+
+        Args:
+            ast: The AST root node
+
+        Returns:
+            ControlFlowGraph instance
+        """
+        cached = self._cache.get(ast)
+        if cached is not None:
+            return cached
+
+        cfg = self._generate(ast)
+        self._cache.put(ast, cfg)
+
+        return cfg
+
+    def _generate(self, ast: ASTNode) -> ControlFlowGraph:
+        """Build a new CFG for an AST.
+
         Args:
             ast: The AST root node
 
@@ -142,24 +182,8 @@ class CFGGenerator:
         Returns:
             List of exit point node IDs
         """
-        node_type = node.node_type
-
-        if node_type == NodeType.MODULE:
-            return self._process_module(node, current_id)
-        elif node_type == NodeType.FUNCTION:
-            return self._process_function(node, current_id)
-        elif node_type == NodeType.IF:
-            return self._process_if(node, current_id)
-        elif node_type == NodeType.FOR:
-            return self._process_for(node, current_id)
-        elif node_type == NodeType.WHILE:
-            return self._process_while(node, current_id)
-        elif node_type == NodeType.TRY:
-            return self._process_try(node, current_id)
-        elif node_type == NodeType.RETURN:
-            return self._process_return(node, current_id)
-        else:
-            return self._process_statement(node, current_id)
+        processor = self._processors.get(node.node_type, self._process_statement)
+        return processor(node, current_id)
 
     def _process_module(self, node: ASTNode, current_id: str) -> list[str]:
         """Process a module node (sequence of statements).
@@ -9,10 +9,37 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from src.core.entities.behavioral_model import DataFlowInfo, NodeType
+from src.shared.utils.cache import IdentityCache
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.core.entities.behavioral_model import ASTNode
 
+# Python built-ins and keywords skipped when tracking name references
+_BUILTIN_NAMES: frozenset[str] = frozenset(
+    {
+        "True",
+        "False",
+        "None",
+        "print",
+        "len",
+        "range",
+        "str",
+        "int",
+        "float",
+        "list",
+        "dict",
+        "set",
+        "tuple",
+        "type",
+        "isinstance",
+        "hasattr",
+        "getattr",
+        "setattr",
+    }
+)
+
 
 class DataFlowAnalyzer:
     """Analyzes data flow in AST representations.
@@ -40,9 +67,48 @@ class DataFlowAnalyzer:
         self._in_assignment = False
         self._current_assignment_target: str | None = None
 
+        # Node-type specific handlers, looked up once per node
+        self._handlers: dict[NodeType, Callable[[ASTNode], None]] = {
+            NodeType.IMPORT: self._analyze_import,
+            NodeType.ASSIGNMENT: self._analyze_assignment,
+            NodeType.CONSTANT: self._analyze_constant,
+            NodeType.NAME: self._analyze_name,
+            NodeType.CALL: self._analyze_call,
+            NodeType.FUNCTION: self._analyze_function,
+            NodeType.CLASS: self._analyze_class,
+            NodeType.ATTRIBUTE: self._analyze_attribute,
+        }
+
+        # Analysis results keyed by AST identity
+        self._cache: IdentityCache[ASTNode, DataFlowInfo] = IdentityCache()
+
     def analyze(self, ast: ASTNode) -> DataFlowInfo:
         """Analyze data flow in an AST.
 
+        Results are cached per AST object, so repeated calls with the same
+        AST return the previous result. ASTNode is frozen except for its
+        ``metadata`` dict, which import and call analysis read; callers must
+        not mutate an AST's metadata after the first analysis, or the
+        cached result goes stale.
+
+        Args:
+            ast: The AST root node
+
+        Returns:
+            DataFlowInfo with extracted information
+        """
+        cached = self._cache.get(ast)
+        if cached is not None:
+            return cached
+
+        info = self._analyze(ast)
+        self._cache.put(ast, info)
+
+        return info
+
+    def _analyze(self, ast: ASTNode) -> DataFlowInfo:
+        """Run a fresh data flow analysis over an AST.
+
         Args:
             ast: The AST root node
 
@@ -77,24 +143,9 @@ class DataFlowAnalyzer:
         Args:
             node: The AST node to analyze
         """
-        node_type = node.node_type
-
-        if node_type == NodeType.IMPORT:
-            self._analyze_import(node)
-        elif node_type == NodeType.ASSIGNMENT:
-            self._analyze_assignment(node)
-        elif node_type == NodeType.CONSTANT:
-            self._analyze_constant(node)
-        elif node_type == NodeType.NAME:
-            self._analyze_name(node)
-        elif node_type == NodeType.CALL:
-            self._analyze_call(node)
-        elif node_type == NodeType.FUNCTION:
-            self._analyze_function(node)
-        elif node_type == NodeType.CLASS:
-            self._analyze_class(node)
-        elif node_type == NodeType.ATTRIBUTE:
-            self._analyze_attribute(node)
+        handler = self._handlers.get(node.node_type)
+        if handler is not None:
+            handler(node)
 
         # Recurse into children
         for child in node.children:
@@ -179,28 +230,7 @@ class DataFlowAnalyzer:
 
         if name:
             # Skip Python built-ins and keywords
-            builtins = {
-                "True",
-                "False",
-                "None",
-                "print",
-                "len",
-                "range",
-                "str",
-                "int",
-                "float",
-                "list",
-                "dict",
-                "set",
-                "tuple",
-                "type",
-                "isinstance",
-                "hasattr",
-                "getattr",
-                "setattr",
-            }
-
-            if name not in builtins:
+            if name not in _BUILTIN_NAMES:
                 # If in assignment context and not the target, it's a read
                 if self._in_assignment and name != self._current_assignment_target:
                     self._state_reads.add(name)
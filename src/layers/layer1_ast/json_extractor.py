@@ -2,6 +2,10 @@ import re
 import json
 from typing import List, Dict, Any, Tuple
 
+# Uses orjson when installed, falling back to json.loads whenever orjson
+# would lose precision on wide integers or reject stdlib-only values.
+from src.shared.utils.json_utils import fast_json_loads as _json_loads
+
 
 class ParsingFailedError(Exception):
     """Raised when no valid JSON could be extracted."""
@@ -20,23 +24,29 @@ def normalize_text(text: str) -> str:
     return text.strip()
 
 
+# Only brace positions matter for block extraction; the regex engine skips
+# everything in between at C speed instead of visiting every character.
+_BRACE_RE = re.compile(r"[{}]")
+
+
 def extract_balanced_json_blocks(text: str) -> List[str]:
     blocks = []
-    stack = []
+    depth = 0
     start_idx = None
 
-    for i, char in enumerate(text):
-        if char == "{":
-            if not stack:
+    for match in _BRACE_RE.finditer(text):
+        i = match.start()
+
+        if text[i] == "{":
+            if depth == 0:
                 start_idx = i
-            stack.append("{")
+            depth += 1
 
-        elif char == "}":
-            if stack:
-                stack.pop()
-                if not stack and start_idx is not None:
-                    blocks.append(text[start_idx:i+1])
-                    start_idx = None
+        elif depth:
+            depth -= 1
+            if depth == 0 and start_idx is not None:
+                blocks.append(text[start_idx:i+1])
+                start_idx = None
 
     return blocks
 
@@ -53,11 +63,11 @@ def attempt_repair(json_str: str) -> str:
 
 def parse_with_recovery(block: str):
     try:
-        return json.loads(block)
+        return _json_loads(block)
     except json.JSONDecodeError:
         repaired = attempt_repair(block)
         try:
-            return json.loads(repaired)
+            return _json_loads(repaired)
         except json.JSONDecodeError as e:
             raise e
 
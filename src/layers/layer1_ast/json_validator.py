@@ -22,7 +22,20 @@ class ASTJSONValidator:
     REQUIRED_ROOT_FIELDS = {"type"}
 
     # Valid node types
-    VALID_NODE_TYPES = {nt.value for nt in NodeType}
+    VALID_NODE_TYPES = frozenset(nt.value for nt in NodeType)
+
+    # Node types that indicate meaningful structure
+    MEANINGFUL_NODE_TYPES = frozenset(
+        {
+            "function",
+            "class",
+            "assignment",
+            "import",
+            "if",
+            "for",
+            "while",
+        }
+    )
 
     def __init__(self, strict: bool = False) -> None:
         """Initialize the validator.
@@ -119,38 +132,34 @@ class ASTJSONValidator:
         # Check for at least some meaningful content
         node_types = self._collect_node_types(ast_json)
 
-        meaningful_types = {
-            "function",
-            "class",
-            "assignment",
-            "import",
-            "if",
-            "for",
-            "while",
-        }
-
-        if not node_types & meaningful_types:
+        if self.MEANINGFUL_NODE_TYPES.isdisjoint(node_types):
             warnings.append("AST contains no meaningful structural nodes")
 
         return len(warnings) == 0, warnings
 
-    def _collect_node_types(self, node: dict[str, Any]) -> set[str]:
+    def _collect_node_types(
+        self,
+        node: dict[str, Any],
+        types: set[str] | None = None,
+    ) -> set[str]:
         """Recursively collect all node types in the AST.
 
         Args:
             node: The root node
+            types: Set to accumulate into (created on the first call)
 
         Returns:
             Set of node type strings
         """
-        types: set[str] = set()
+        if types is None:
+            types = set()
 
         if "type" in node:
             types.add(node["type"])
 
         for child in node.get("children", []):
             if isinstance(child, dict):
-                types.update(self._collect_node_types(child))
+                self._collect_node_types(child, types)
 
         return types
 
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from src.core.entities.behavioral_model import NodeType
+
 if TYPE_CHECKING:
     from src.core.entities.behavioral_model import ASTNode
 
@@ -36,6 +38,25 @@ class SBTTransformer:
         self.include_names = include_names
         self.max_depth = max_depth
 
+        # Opening/closing tokens per node type, built once instead of per node
+        self._open_tokens: dict[NodeType, str] = {}
+        self._close_tokens: dict[NodeType, str] = {}
+        for node_type in NodeType:
+            label = self._type_label(node_type)
+            self._open_tokens[node_type] = f"({label}"
+            self._close_tokens[node_type] = f"){label}"
+
+    def _type_label(self, node_type: NodeType) -> str:
+        """Return the label used for a node type in SBT tokens.
+
+        Args:
+            node_type: The AST node type
+
+        Returns:
+            Label placed after the opening/closing parenthesis
+        """
+        return node_type.value
+
     def transform(self, ast: ASTNode) -> str:
         """Transform AST to SBT string representation.
 
@@ -45,9 +66,7 @@ class SBTTransformer:
         Returns:
             SBT string representation
         """
-        tokens: list[str] = []
-        self._traverse(ast, tokens, depth=0)
-        return " ".join(tokens)
+        return " ".join(self.transform_to_tokens(ast))
 
     def transform_to_tokens(self, ast: ASTNode) -> list[str]:
         """Transform AST to list of SBT tokens.
@@ -79,8 +98,8 @@ class SBTTransformer:
             return
 
         # Opening token with node type
-        type_str = node.node_type.value
-        tokens.append(f"({type_str}")
+        node_type = node.node_type
+        tokens.append(self._open_tokens[node_type])
 
         # Include name if present and enabled
         if self.include_names and node.name:
@@ -96,7 +115,7 @@ class SBTTransformer:
             self._traverse(child, tokens, depth + 1)
 
         # Closing token
-        tokens.append(f"){type_str}")
+        tokens.append(self._close_tokens[node_type])
 
     def _format_value(self, value: object) -> str:
         """Format a value for SBT representation.
@@ -150,6 +169,11 @@ class CompactSBTTransformer(SBTTransformer):
         "unknown": "U",
     }
 
+    # Node types whose names are kept in the compact form
+    NAMED_TYPES = frozenset(
+        {NodeType.FUNCTION, NodeType.CLASS, NodeType.ASSIGNMENT, NodeType.NAME}
+    )
+
     def __init__(self, max_depth: int | None = 10) -> None:
         """Initialize compact transformer with defaults."""
         super().__init__(
@@ -158,6 +182,17 @@ class CompactSBTTransformer(SBTTransformer):
             max_depth=max_depth,
         )
 
+    def _type_label(self, node_type: NodeType) -> str:
+        """Return the abbreviated label for a node type.
+
+        Args:
+            node_type: The AST node type
+
+        Returns:
+            Abbreviation from TYPE_ABBREV ("U" if none is defined)
+        """
+        return self.TYPE_ABBREV.get(node_type.value, "U")
+
     def _traverse(
         self,
         node: ASTNode,
@@ -175,16 +210,11 @@ class CompactSBTTransformer(SBTTransformer):
             return
 
         # Use abbreviated type
-        type_str = self.TYPE_ABBREV.get(node.node_type.value, "U")
-        tokens.append(f"({type_str}")
+        node_type = node.node_type
+        tokens.append(self._open_tokens[node_type])
 
         # Include name for important nodes only
-        if self.include_names and node.name and node.node_type.value in (
-            "function",
-            "class",
-            "assignment",
-            "name",
-        ):
+        if self.include_names and node.name and node_type in self.NAMED_TYPES:
             tokens.append(f"[{node.name}]")
 
         # Traverse children
@@ -192,4 +222,4 @@ class CompactSBTTransformer(SBTTransformer):
             self._traverse(child, tokens, depth + 1)
 
         # Closing token
-        tokens.append(f"){type_str}")
+        tokens.append(self._close_tokens[node_type])
@@ -56,6 +56,20 @@ class SemanticScorer:
         "control_flow": {"min": 0, "good": 2},
     }
 
+    # Element category counted for each AST node type
+    _TYPE_CATEGORIES = {
+        "import": "imports",
+        "assignment": "assignments",
+        "constant": "constants",
+        "function": "functions",
+        "class": "classes",
+        "if": "control_flow",
+        "for": "control_flow",
+        "while": "control_flow",
+        "try": "control_flow",
+        "with": "control_flow",
+    }
+
     def calculate_score(self, ast_json: dict[str, Any]) -> float:
         """Calculate the semantic score for an AST.
 
@@ -80,28 +94,28 @@ class SemanticScorer:
         Returns:
             SemanticScoreBreakdown with component scores
         """
-        # Collect elements from AST
-        elements = self._collect_elements(ast_json)
+        # Count elements in AST
+        counts = self._count_elements(ast_json)
 
         # Calculate individual scores
         import_score = self._score_component(
-            len(elements["imports"]),
+            counts["imports"],
             self.THRESHOLDS["imports"],
         )
         assignment_score = self._score_component(
-            len(elements["assignments"]) + len(elements["constants"]),
+            counts["assignments"] + counts["constants"],
             self.THRESHOLDS["assignments"],
         )
         type_score = self._score_component(
-            len(elements["types"]),
+            counts["types"],
             self.THRESHOLDS["types"],
         )
         function_score = self._score_component(
-            len(elements["functions"]) + len(elements["classes"]),
+            counts["functions"] + counts["classes"],
             self.THRESHOLDS["functions"],
         )
         control_flow_score = self._score_component(
-            len(elements["control_flow"]),
+            counts["control_flow"],
             self.THRESHOLDS["control_flow"],
         )
 
@@ -151,68 +165,58 @@ class SemanticScorer:
             # Above good threshold
             return min(1.0, 0.8 + 0.2 * (count / (thresholds["good"] * 2)))
 
-    def _collect_elements(self, ast_json: dict[str, Any]) -> dict[str, list[Any]]:
-        """Collect categorized elements from the AST.
+    def _count_elements(self, ast_json: dict[str, Any]) -> dict[str, int]:
+        """Count categorized elements in the AST.
+
+        Only the number of elements per category feeds into the score, so
+        the tree is walked once with an explicit stack and each node bumps
+        a counter instead of being collected into a list.
 
         Args:
             ast_json: The AST JSON
 
         Returns:
-            Dictionary of element lists by category
-        """
-        elements: dict[str, list[Any]] = {
-            "imports": [],
-            "assignments": [],
-            "constants": [],
-            "types": [],
-            "functions": [],
-            "classes": [],
-            "control_flow": [],
-        }
-
-        self._traverse_and_collect(ast_json, elements)
-        return elements
-
-    def _traverse_and_collect(
-        self,
-        node: dict[str, Any],
-        elements: dict[str, list[Any]],
-    ) -> None:
-        """Recursively traverse and collect elements.
-
-        Args:
-            node: The current node
-            elements: Dictionary to accumulate elements
+            Dictionary of element counts by category
         """
-        node_type = node.get("type", "")
-
-        # Categorize by type
-        if node_type == "import":
-            elements["imports"].append(node)
-        elif node_type == "assignment":
-            elements["assignments"].append(node)
-            # Check if it's a constant (uppercase name)
-            name = node.get("name", "")
-            if name and name.isupper():
-                elements["constants"].append(node)
-        elif node_type == "constant":
-            elements["constants"].append(node)
-        elif node_type == "function":
-            elements["functions"].append(node)
-        elif node_type == "class":
-            elements["classes"].append(node)
-        elif node_type in ("if", "for", "while", "try", "with"):
-            elements["control_flow"].append(node)
-
-        # Check for type annotations in metadata
-        metadata = node.get("metadata", {})
-        if metadata.get("type_annotation") or metadata.get("return_type"):
-            elements["types"].append(node)
-
-        # Traverse children
-        for child in node.get("children", []):
-            if isinstance(child, dict):
-                self._traverse_and_collect(child, elements)
+        counts = dict.fromkeys(
+            (
+                "imports",
+                "assignments",
+                "constants",
+                "types",
+                "functions",
+                "classes",
+                "control_flow",
+            ),
+            0,
+        )
+        categories = self._TYPE_CATEGORIES
+        stack = [ast_json]
+
+        while stack:
+            node = stack.pop()
+            node_type = node.get("type", "")
+
+            # Categorize by type
+            category = categories.get(node_type) if type(node_type) is str else None
+            if category is not None:
+                counts[category] += 1
+                if category == "assignments":
+                    # Check if it's a constant (uppercase name)
+                    name = node.get("name", "")
+                    if name and name.isupper():
+                        counts["constants"] += 1
+
+            # Check for type annotations in metadata
+            metadata = node.get("metadata")
+            if metadata and (metadata.get("type_annotation") or metadata.get("return_type")):
+                counts["types"] += 1
+
+            for child in node.get("children", ()):
+                if isinstance(child, dict):
+                    stack.append(child)
+
+        return counts
 
     def is_acceptable(
         self,
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from src.core.interfaces.vector_store import SearchResult
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AssembledContext:
     """Assembled context for LLM processing.
 
@@ -74,13 +74,19 @@ class ContextAssembler:
         spec_parts: list[str] = []
         sources: list[str] = []
         current_chars = 0
+        spec_budget = self.max_context_chars * 0.7
 
         # Add specification context
         for i, result in enumerate(search_results):
+            # The formatted excerpt is never shorter than its content, so an
+            # oversized result can be rejected before formatting it
+            if current_chars + len(result.content) > spec_budget:
+                break
+
             chunk_text = self._format_spec_chunk(result, i + 1)
             chunk_chars = len(chunk_text)
 
-            if current_chars + chunk_chars > self.max_context_chars * 0.7:
+            if current_chars + chunk_chars > spec_budget:
                 break
 
             spec_parts.append(chunk_text)
@@ -33,7 +33,10 @@ class DocumentParser(LoggerMixin):
 
     def __init__(self) -> None:
         """Initialize the document parser."""
-        self._section_pattern = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+        # Heading whitespace must not cross a line break, so a bare "#" line
+        # is not read as a heading of the line below it
+        self._section_pattern = re.compile(r"^#{1,6}[^\S\n]+(.+)$", re.MULTILINE)
+        self._title_pattern = re.compile(r"^#\s+(.+)$", re.MULTILINE)
         self._python_docstring_pattern = re.compile(r'"""(.*?)"""', re.DOTALL)
         self._rst_section_pattern = re.compile(r"^(.+)\n[=\-~^]+$", re.MULTILINE)
 
@@ -173,29 +176,33 @@ class DocumentParser(LoggerMixin):
         sections: dict[str, str] = {}
 
         # Extract title from first heading
-        title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+        title_match = self._title_pattern.search(content)
         title = title_match.group(1) if title_match else Path(metadata.file_path).stem
 
-        # Extract sections by headings
-        current_section = "introduction"
-        current_content: list[str] = []
-
-        for line in content.split("\n"):
-            heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-            if heading_match:
-                # Save previous section
-                if current_content:
-                    sections[current_section] = "\n".join(current_content).strip()
-
-                # Start new section
-                current_section = heading_match.group(2).lower().replace(" ", "_")
-                current_content = []
+        # Extract sections by headings in a single scan. A section is kept
+        # when it has at least one line of its own, even a blank one.
+        headings = list(self._section_pattern.finditer(content))
+
+        if not headings:
+            sections["introduction"] = content.strip()
+        elif headings[0].start() > 0:
+            sections["introduction"] = content[: headings[0].start()].strip()
+
+        for i, heading in enumerate(headings):
+            section_name = heading.group(1).lower().replace(" ", "_")
+            if i + 1 < len(headings):
+                body = content[heading.end() : headings[i + 1].start()]
+                # Between headings the body opens with the heading's line
+                # break and closes with the one before the next heading:
+                # at least one line between headings needs two of them
+                has_lines = body.count("\n") >= 2
             else:
-                current_content.append(line)
+                body = content[heading.end() :]
+                # A trailing heading has a line only if a line break follows
+                has_lines = bool(body)
 
-        # Save last section
-        if current_content:
-            sections[current_section] = "\n".join(current_content).strip()
+            if has_lines:
+                sections[section_name] = body.strip()
 
         return SpecificationDocument(
             doc_id=f"doc-{uuid4().hex[:8]}",
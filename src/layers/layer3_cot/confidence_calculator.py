@@ -14,11 +14,18 @@ from src.core.entities.confidence_score import (
     EvidenceItem,
     EvidenceType,
 )
+from src.core.entities.verification_result import FindingSeverity
+from src.core.exceptions import ValidationError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from src.core.entities.verification_result import Finding
     from src.core.interfaces.vector_store import SearchResult
 
+# Allowed deviation of the component weights' sum from 1.0
+_WEIGHT_TOLERANCE = 0.01
+
 
 class ConfidenceCalculator:
     """Calculates confidence scores for verification findings.
@@ -44,7 +51,19 @@ class ConfidenceCalculator:
             context_weight: Weight for context score
             reasoning_weight: Weight for reasoning score
             coverage_weight: Weight for coverage score
+
+        Raises:
+            ValidationError: If the weights do not sum to 1.0
         """
+        total_weight = evidence_weight + context_weight + reasoning_weight + coverage_weight
+        if abs(total_weight - 1.0) > _WEIGHT_TOLERANCE:
+            raise ValidationError(
+                f"Confidence weights must sum to 1.0, got {total_weight:.2f}",
+                field="weights",
+                value=total_weight,
+                expected="Weights summing to 1.0",
+            )
+
         self.evidence_weight = evidence_weight
         self.context_weight = context_weight
         self.reasoning_weight = reasoning_weight
@@ -106,6 +125,29 @@ class ConfidenceCalculator:
             calibration_adjustment=calibration_adjustment,
         )
 
+    def calculate_many(
+        self,
+        findings: Sequence[Finding],
+        evidences: Sequence[list[SearchResult]],
+    ) -> list[ConfidenceScore]:
+        """Calculate confidence scores for several findings.
+
+        Args:
+            findings: The findings to score
+            evidences: Supporting evidence for each finding, in the same order
+
+        Returns:
+            ConfidenceScore for each finding
+
+        Raises:
+            ValueError: If findings and evidences differ in length
+        """
+        calculate = self.calculate
+        return [
+            calculate(finding, evidence)
+            for finding, evidence in zip(findings, evidences, strict=True)
+        ]
+
     def _build_evidence_items(
         self,
         finding: Finding,
@@ -329,8 +371,6 @@ class ConfidenceCalculator:
         Returns:
             Calibration adjustment
         """
-        from src.core.entities.verification_result import FindingSeverity
-
         # For high/critical findings, be more conservative
         if finding.severity in (FindingSeverity.CRITICAL, FindingSeverity.HIGH):
             if base_score > 0.8:
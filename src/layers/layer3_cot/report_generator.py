@@ -6,7 +6,6 @@ This module generates reports in various formats from verification results.
 from __future__ import annotations
 
 import json
-from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -15,8 +14,41 @@ from src.shared.constants import SARIF_SCHEMA_URI, SARIF_SCHEMA_VERSION
 from src.shared.logger import LoggerMixin
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from src.core.entities.verification_result import VerificationResult
 
+# SARIF tool metadata
+_SARIF_TOOL_NAME = "eth-spec-compliance-verifier"
+_SARIF_TOOL_VERSION = "0.1.0"
+_SARIF_TOOL_URI = "https://github.com/your-org/eth-spec-compliance-verifier"
+
+# Finding severity to SARIF level
+_SARIF_LEVELS = {
+    "critical": "error",
+    "high": "error",
+    "medium": "warning",
+    "low": "note",
+    "info": "note",
+}
+
+# Verification status to PR comment emoji
+_STATUS_EMOJI = {
+    "PASS": "",
+    "FAIL": "",
+    "PARTIAL": "",
+    "UNKNOWN": "",
+    "PENDING": "",
+}
+
+# Severity order for PR comment finding groups
+_SEVERITY_ORDER = ("critical", "high", "medium", "low", "info")
+
+
+def _nested_json(value: Any, level: int) -> str:
+    """Serialize a value as 2-space indented JSON nested at the given depth."""
+    return json.dumps(value, indent=2, default=str).replace("\n", "\n" + "  " * level)
+
 
 class JSONReportGenerator(ReportGenerator, LoggerMixin):
     """Generates verification reports in various formats."""
@@ -64,10 +96,48 @@ class JSONReportGenerator(ReportGenerator, LoggerMixin):
             output_path: Output file path
             format: Output format
         """
-        content = await self.generate(result, format)
-        output_path.write_text(content, encoding="utf-8")
+        if format == ReportFormat.JSON:
+            # Write JSON reports finding by finding instead of building the
+            # whole document in memory first
+            with output_path.open("w", encoding="utf-8") as f:
+                async for chunk in self.stream(result):
+                    f.write(chunk)
+        else:
+            content = await self.generate(result, format)
+            output_path.write_text(content, encoding="utf-8")
         self.logger.info("report_saved", path=str(output_path), format=format.value)
 
+    async def stream(self, result: VerificationResult) -> AsyncIterator[str]:
+        """Stream the JSON report in chunks.
+
+        The concatenated chunks are identical to the JSON format of
+        generate(), but findings are serialized one at a time so large
+        reports never have to be held in memory as a single string.
+
+        Args:
+            result: Verification result
+
+        Yields:
+            Consecutive pieces of the JSON report
+        """
+        # Key order comes from VerificationResult.to_dict(); only the
+        # findings are left out there and streamed one at a time here
+        data = result.to_dict(include_findings=False)
+        last = len(data) - 1
+
+        yield "{\n"
+        for i, (key, value) in enumerate(data.items()):
+            end = "\n" if i == last else ",\n"
+            if key != "findings" or not result.findings:
+                yield f'  "{key}": {_nested_json(value, 1)}{end}'
+                continue
+            yield '  "findings": [\n'
+            for j, finding in enumerate(result.findings):
+                separator = ",\n" if j else ""
+                yield f"{separator}    {_nested_json(finding.to_dict(), 2)}"
+            yield f"\n  ]{end}"
+        yield "}"
+
     async def generate_pr_comment(
         self,
         result: VerificationResult,
@@ -110,7 +180,7 @@ class JSONReportGenerator(ReportGenerator, LoggerMixin):
                     by_severity[sev] = []
                 by_severity[sev].append(finding)
 
-            for severity in ["critical", "high", "medium", "low", "info"]:
+            for severity in _SEVERITY_ORDER:
                 if severity in by_severity:
                     lines.append(f"#### {severity.title()} ({len(by_severity[severity])})")
                     for finding in by_severity[severity][:5]:
@@ -182,9 +252,9 @@ class JSONReportGenerator(ReportGenerator, LoggerMixin):
                 {
                     "tool": {
                         "driver": {
-                            "name": "eth-spec-compliance-verifier",
-                            "version": "0.1.0",
-                            "informationUri": "https://github.com/your-org/eth-spec-compliance-verifier",
+                            "name": _SARIF_TOOL_NAME,
+                            "version": _SARIF_TOOL_VERSION,
+                            "informationUri": _SARIF_TOOL_URI,
                             "rules": self._generate_sarif_rules(result),
                         }
                     },
@@ -402,14 +472,7 @@ class JSONReportGenerator(ReportGenerator, LoggerMixin):
         Returns:
             SARIF level
         """
-        mapping = {
-            "critical": "error",
-            "high": "error",
-            "medium": "warning",
-            "low": "note",
-            "info": "note",
-        }
-        return mapping.get(severity, "warning")
+        return _SARIF_LEVELS.get(severity, "warning")
 
     def _get_status_emoji(self, status: str) -> str:
         """Get emoji for status.
@@ -420,11 +483,4 @@ class JSONReportGenerator(ReportGenerator, LoggerMixin):
         Returns:
             Emoji character
         """
-        mapping = {
-            "PASS": "",
-            "FAIL": "",
-            "PARTIAL": "",
-            "UNKNOWN": "",
-            "PENDING": "",
-        }
-        return mapping.get(status, "")
+        return _STATUS_EMOJI.get(status, "")
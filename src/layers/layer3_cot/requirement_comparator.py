@@ -6,13 +6,60 @@ requirements and code behavior.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.core.entities.behavioral_model import BehavioralModel
-    from src.core.entities.specification import Constraint, Invariant, Requirement
+    from src.core.entities.specification import (
+        Constraint,
+        Invariant,
+        NormalizedSpecification,
+        Requirement,
+    )
+
+
+# Identifier-like words in requirement text
+_WORD_RE = re.compile(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b")
+
+# Integer literals in constraint text
+_NUMBER_RE = re.compile(r"\d+")
+
+# Common words ignored when extracting key terms
+_STOP_WORDS: frozenset[str] = frozenset(
+    {
+        "the", "a", "an", "is", "are", "be", "been", "being",
+        "have", "has", "had", "do", "does", "did", "will", "would",
+        "could", "should", "may", "might", "must", "shall",
+        "to", "of", "in", "for", "on", "with", "at", "by", "from",
+        "this", "that", "these", "those", "it", "its",
+        "and", "or", "but", "if", "then", "when", "where",
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _extract_key_terms_cached(text: str) -> tuple[str, ...]:
+    """Extract key terms from requirement text (cached per text).
+
+    The same requirement descriptions are compared against many models
+    during a run, so tokenization results are shared across calls.
+
+    Args:
+        text: Requirement text
+
+    Returns:
+        Tuple of key terms
+    """
+    # Extract words
+    words = _WORD_RE.findall(text.lower())
+
+    # Filter and return unique terms
+    terms = [w for w in words if w not in _STOP_WORDS and len(w) > 2]
+    return tuple(set(terms))[:10]  # Limit to 10 terms
 
 
 class ComparisonResult(str, Enum):
@@ -25,7 +72,7 @@ class ComparisonResult(str, Enum):
     NOT_APPLICABLE = "not_applicable"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ComparisonDetail:
     """Detailed comparison result.
 
@@ -69,6 +116,81 @@ class RequirementComparator:
             requirement: The requirement to check
             behavioral_model: Code behavioral model
 
+        Returns:
+            ComparisonDetail with results
+        """
+        return self._compare_requirement(
+            requirement,
+            behavioral_model,
+            self._data_flow_text(behavioral_model),
+        )
+
+    def compare_all(
+        self,
+        spec: NormalizedSpecification,
+        behavioral_model: BehavioralModel,
+    ) -> list[ComparisonDetail]:
+        """Compare every requirement, constraint and invariant of a spec.
+
+        Args:
+            spec: Normalized specification to check
+            behavioral_model: Code behavioral model
+
+        Returns:
+            ComparisonDetail for each requirement, then each constraint,
+            then each invariant, in specification order
+        """
+        # The lower-cased data flow text only depends on the model, so it is
+        # built once for the whole batch
+        data_flow_text = self._data_flow_text(behavioral_model)
+
+        details = [
+            self._compare_requirement(requirement, behavioral_model, data_flow_text)
+            for requirement in spec.requirements
+        ]
+        details.extend(
+            self.compare_constraint(constraint, behavioral_model)
+            for constraint in spec.constraints
+        )
+        details.extend(
+            self.compare_invariant(invariant, behavioral_model)
+            for invariant in spec.invariants
+        )
+        return details
+
+    def _data_flow_text(self, behavioral_model: BehavioralModel) -> tuple[str, str, str]:
+        """Lower-case and join the data flow collections of a model.
+
+        Each collection is joined with a separator no key term contains, so
+        "term in joined" is equivalent to the term occurring in any single
+        element.
+
+        Args:
+            behavioral_model: Code behavioral model
+
+        Returns:
+            Tuple of (state writes, function calls, constants) text
+        """
+        data_flow = behavioral_model.data_flow
+        return (
+            "\n".join(data_flow.state_writes).lower(),
+            "\n".join(data_flow.function_calls).lower(),
+            "\n".join(str(c) for c in data_flow.constants).lower(),
+        )
+
+    def _compare_requirement(
+        self,
+        requirement: Requirement,
+        behavioral_model: BehavioralModel,
+        data_flow_text: tuple[str, str, str],
+    ) -> ComparisonDetail:
+        """Compare a requirement using precomputed data flow text.
+
+        Args:
+            requirement: The requirement to check
+            behavioral_model: Code behavioral model
+            data_flow_text: Result of _data_flow_text() for the model
+
         Returns:
             ComparisonDetail with results
         """
@@ -86,22 +208,24 @@ class RequirementComparator:
         matches = 0
         total_checks = 0
 
+        state_writes, function_calls, constants = data_flow_text
+
         # Check data flow
         for term in key_terms:
             total_checks += 1
 
             # Check state writes
-            if any(term in w.lower() for w in behavioral_model.data_flow.state_writes):
+            if term in state_writes:
                 matches += 1
                 evidence.append(f"State modification matches: {term}")
 
             # Check function calls
-            elif any(term in f.lower() for f in behavioral_model.data_flow.function_calls):
+            elif term in function_calls:
                 matches += 1
                 evidence.append(f"Function call matches: {term}")
 
             # Check constants
-            elif any(term in str(c).lower() for c in behavioral_model.data_flow.constants):
+            elif term in constants:
                 matches += 1
                 evidence.append(f"Constant matches: {term}")
 
@@ -161,9 +285,7 @@ class RequirementComparator:
         desc_lower = constraint.description.lower()
 
         # Look for numeric constraints
-        import re
-
-        numbers = re.findall(r"\d+", constraint.description)
+        numbers = _NUMBER_RE.findall(constraint.description)
 
         # Check if constants match expected values
         constant_strs = [str(c) for c in behavioral_model.data_flow.constants]
@@ -245,24 +367,7 @@ class RequirementComparator:
         Returns:
             List of key terms
         """
-        import re
-
-        # Remove common words
-        stop_words = {
-            "the", "a", "an", "is", "are", "be", "been", "being",
-            "have", "has", "had", "do", "does", "did", "will", "would",
-            "could", "should", "may", "might", "must", "shall",
-            "to", "of", "in", "for", "on", "with", "at", "by", "from",
-            "this", "that", "these", "those", "it", "its",
-            "and", "or", "but", "if", "then", "when", "where",
-        }
-
-        # Extract words
-        words = re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b", text.lower())
-
-        # Filter and return unique terms
-        terms = [w for w in words if w not in stop_words and len(w) > 2]
-        return list(set(terms))[:10]  # Limit to 10 terms
+        return list(_extract_key_terms_cached(text))
 
     def _generate_suggestion(
         self,
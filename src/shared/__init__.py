@@ -5,7 +5,9 @@ from src.shared.constants import (
     DEFAULT_CONFIDENCE_THRESHOLD,
     DEFAULT_FORK,
     SUPPORTED_FORKS,
+    SUPPORTED_FORKS_SET,
     SUPPORTED_LANGUAGES,
+    SUPPORTED_LANGUAGES_SET,
 )
 from src.shared.logger import get_logger, setup_logging
 
@@ -13,7 +15,9 @@ __all__ = [
     "DEFAULT_CONFIDENCE_THRESHOLD",
     "DEFAULT_FORK",
     "SUPPORTED_FORKS",
+    "SUPPORTED_FORKS_SET",
     "SUPPORTED_LANGUAGES",
+    "SUPPORTED_LANGUAGES_SET",
     "Settings",
     "get_logger",
     "get_settings",
@@ -8,13 +8,80 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
+from dotenv import dotenv_values
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
-class LLMSettings(BaseSettings):
+ENV_FILE = ".env"
+
+
+@lru_cache
+def _read_env_file() -> dict[str, str]:
+    """Read the .env file once and cache its values.
+
+    Returns:
+        Mapping of variable names to values (empty if there is no .env file)
+    """
+    env_path = Path(ENV_FILE)
+    if not env_path.is_file():
+        return {}
+    values = dotenv_values(env_path, encoding="utf-8")
+    return {key: value for key, value in values.items() if value is not None}
+
+
+class _EnvFileSnapshotSource(EnvSettingsSource):
+    """Settings source that serves values from the cached .env snapshot.
+
+    Matching, prefixes and value parsing follow the regular environment
+    source; only the variables come from ``_read_env_file`` instead of
+    ``os.environ``.
+    """
+
+    # Overrides a private hook of pydantic-settings (present since 2.0):
+    # EnvSettingsSource calls _load_env_vars() once in __init__ to collect
+    # the variables it matches fields against. Re-check this on upgrades.
+    def _load_env_vars(self) -> Mapping[str, str | None]:
+        values = _read_env_file()
+        if self.case_sensitive:
+            return values
+        return {key.lower(): value for key, value in values.items()}
+
+
+class _EnvFileSettings(BaseSettings):
+    """Base class for settings that read the shared .env snapshot.
+
+    Environment variables take precedence over values from the .env file,
+    which in turn override field defaults.
+    """
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            init_settings,
+            env_settings,
+            _EnvFileSnapshotSource(settings_cls),
+            file_secret_settings,
+        )
+
+
+class LLMSettings(_EnvFileSettings):
     """LLM provider configuration."""
 
     model_config = SettingsConfigDict(env_prefix="GEMINI_")
@@ -29,7 +96,7 @@ class LLMSettings(BaseSettings):
     max_tokens: int = Field(default=8192, ge=1)
 
 
-class VectorStoreSettings(BaseSettings):
+class VectorStoreSettings(_EnvFileSettings):
     """Vector store configuration."""
 
     model_config = SettingsConfigDict(env_prefix="CHROMADB_")
@@ -41,7 +108,7 @@ class VectorStoreSettings(BaseSettings):
     )
 
 
-class KnowledgeGraphSettings(BaseSettings):
+class KnowledgeGraphSettings(_EnvFileSettings):
     """Knowledge graph (Neo4j) configuration."""
 
     model_config = SettingsConfigDict(env_prefix="NEO4J_")
@@ -52,7 +119,7 @@ class KnowledgeGraphSettings(BaseSettings):
     database: str = Field(default="neo4j", description="Neo4j database name")
 
 
-class GitHubSettings(BaseSettings):
+class GitHubSettings(_EnvFileSettings):
     """GitHub integration configuration."""
 
     model_config = SettingsConfigDict(env_prefix="GITHUB_")
@@ -66,7 +133,7 @@ class GitHubSettings(BaseSettings):
     token: str = Field(default="", description="GitHub personal access token")
 
 
-class EthereumSettings(BaseSettings):
+class EthereumSettings(_EnvFileSettings):
     """Ethereum specification configuration."""
 
     execution_specs_repo: str = Field(
@@ -80,7 +147,7 @@ class EthereumSettings(BaseSettings):
     default_fork: str = Field(default="cancun", description="Default fork version")
 
 
-class Settings(BaseSettings):
+class Settings(_EnvFileSettings):
     """Main application settings.
 
     Loads configuration from environment variables with the following precedence:
@@ -90,8 +157,6 @@ class Settings(BaseSettings):
     """
 
     model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
         extra="ignore",
         case_sensitive=False,
     )
@@ -159,10 +224,9 @@ class Settings(BaseSettings):
 
     def ensure_directories(self) -> None:
         """Ensure all required directories exist."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.specs_dir.mkdir(parents=True, exist_ok=True)
-        self.embeddings_dir.mkdir(parents=True, exist_ok=True)
-        Path(self.vector_store.path).mkdir(parents=True, exist_ok=True)
+        # data_dir is created as a parent of the leaf directories
+        for directory in (self.specs_dir, self.embeddings_dir, Path(self.vector_store.path)):
+            directory.mkdir(parents=True, exist_ok=True)
 
 
 @lru_cache
@@ -181,5 +245,20 @@ def reload_settings() -> Settings:
     Returns:
         Fresh Settings instance
     """
+    _read_env_file.cache_clear()
     get_settings.cache_clear()
     return get_settings()
+
+
+def snapshot_settings() -> Settings:
+    """Get an independent copy of the cached settings.
+
+    The copy is built from the already-validated cached instance, so it
+    skips environment parsing and field validation. Useful for tests and
+    workers that need to modify settings without affecting the shared
+    instance.
+
+    Returns:
+        Deep copy of the cached Settings instance
+    """
+    return get_settings().model_copy(deep=True)
@@ -32,6 +32,9 @@ SUPPORTED_FORKS: Final[tuple[str, ...]] = (
     "prague",
 )
 
+# Set view of SUPPORTED_FORKS for membership checks
+SUPPORTED_FORKS_SET: Final[frozenset[str]] = frozenset(SUPPORTED_FORKS)
+
 DEFAULT_FORK: Final[str] = "cancun"
 
 # =============================================================================
@@ -47,6 +50,9 @@ SUPPORTED_LANGUAGES: Final[tuple[str, ...]] = (
     "typescript",
 )
 
+# Set view of SUPPORTED_LANGUAGES for membership checks
+SUPPORTED_LANGUAGES_SET: Final[frozenset[str]] = frozenset(SUPPORTED_LANGUAGES)
+
 DEFAULT_LANGUAGE: Final[str] = "python"
 
 # =============================================================================
@@ -13,6 +13,19 @@ from typing import Any
 import structlog
 from structlog.types import Processor
 
+# Standard library log levels keyed by their upper-case names, including the
+# aliases that logging itself defines (WARN, FATAL)
+_LEVELS: dict[str, int] = {
+    "NOTSET": logging.NOTSET,
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+}
+
 
 def setup_logging(
     level: str = "INFO",
@@ -27,11 +40,13 @@ def setup_logging(
         format: Output format ('console' or 'json')
         include_timestamp: Whether to include timestamps in logs
     """
+    log_level = _LEVELS[level.upper()]
+
     # Configure standard library logging
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, level.upper()),
+        level=log_level,
     )
 
     # Build processor chain
@@ -66,9 +81,7 @@ def setup_logging(
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, level.upper())
-        ),
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(),
         cache_logger_on_first_use=True,
@@ -1,7 +1,9 @@
 """Shared utility functions."""
 
+from src.shared.utils.cache import FIFOCache, IdentityCache
 from src.shared.utils.json_utils import (
     extract_json_from_text,
+    fast_json_loads,
     safe_json_dumps,
     safe_json_loads,
     validate_json_schema,
@@ -19,8 +21,12 @@ from src.shared.utils.validation import (
 )
 
 __all__ = [
+    # Cache utilities
+    "FIFOCache",
+    "IdentityCache",
     # JSON utilities
     "extract_json_from_text",
+    "fast_json_loads",
     "safe_json_dumps",
     "safe_json_loads",
     "validate_json_schema",
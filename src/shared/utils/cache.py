@@ -0,0 +1,81 @@
+"""Small in-memory cache helpers.
+
+This module provides bounded caches for memoizing results of pure
+computations on immutable inputs.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+T = TypeVar("T")
+
+# Default number of entries remembered per cache
+DEFAULT_CACHE_SIZE = 128
+
+
+class FIFOCache(Generic[K, V]):
+    """Bounded mapping that evicts its oldest entry once full.
+
+    Dicts keep insertion order, so the first key is always the oldest.
+    """
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries: dict[K, V] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for key, or None if absent."""
+        return self._entries.get(key)
+
+    def put(self, key: K, value: V) -> None:
+        """Store a value, evicting the oldest entry if the cache is full."""
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = value
+
+
+class IdentityCache(Generic[T, V]):
+    """Bounded FIFO cache keyed by object identity.
+
+    Suited to immutable but unhashable (or expensive to hash) inputs such
+    as AST trees. The key object is kept alongside the value so its id()
+    cannot be reused by another object while the entry is cached.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self._entries: FIFOCache[int, tuple[T, V]] = FIFOCache(maxsize)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, obj: T) -> V | None:
+        """Return the value cached for this exact object, or None."""
+        entry = self._entries.get(id(obj))
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+        return None
+
+    def put(self, obj: T, value: V) -> None:
+        """Store a value for obj, evicting the oldest entry if full."""
+        self._entries.put(id(obj), (obj, value))
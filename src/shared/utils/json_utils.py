@@ -10,6 +10,48 @@ import json
 import re
 from typing import Any
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional speedup
+    _HAS_ORJSON = False
+
+# Sentinel for absent keys, distinct from an explicit None value
+_MISSING = object()
+
+# Digit runs long enough to exceed 64 bits. orjson turns such integers into
+# floats, which would corrupt uint256 values (wei amounts, hashes, slots).
+_LONG_NUMBER_RE = re.compile(r"\d{19,}")
+
+
+def fast_json_loads(text: str) -> Any:
+    """Parse JSON with the same results as json.loads.
+
+    orjson (optional "fast" extra) is used only when its result is identical
+    to the stdlib's: inputs that may hold integers wider than 64 bits go
+    straight to json.loads, and anything orjson rejects (NaN, Infinity,
+    out-of-range floats, ...) is re-parsed by json.loads, which also
+    produces the error for genuinely invalid input.
+
+    Args:
+        text: The JSON string to parse
+
+    Returns:
+        Parsed data
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    if _HAS_ORJSON and not _LONG_NUMBER_RE.search(text):
+        try:
+            return orjson.loads(text)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        except json.JSONDecodeError:
+            pass
+
+    return json.loads(text)
+
 
 def safe_json_loads(text: str) -> tuple[Any | None, str | None]:
     """Safely parse JSON from a string.
@@ -23,7 +65,7 @@ def safe_json_loads(text: str) -> tuple[Any | None, str | None]:
         - If failed: (None, error_message)
     """
     try:
-        data = json.loads(text)
+        data = fast_json_loads(text)
         return data, None
     except json.JSONDecodeError as e:
         return None, f"JSON decode error at position {e.pos}: {e.msg}"
@@ -44,6 +86,9 @@ def safe_json_dumps(
     Returns:
         JSON string representation
     """
+    # Always the stdlib: orjson's output differs (compact separators,
+    # RFC 3339 datetimes, NaN as null, float formatting), and callers
+    # depend on this text being stable regardless of installed extras
     return json.dumps(
         data,
         indent=indent,
@@ -65,6 +110,9 @@ def extract_json_from_text(text: str) -> list[dict[str, Any]]:
         List of successfully parsed JSON objects
     """
     results: list[dict[str, Any]] = []
+    # Canonical serializations of the objects collected so far, used to
+    # drop duplicates without comparing against every previous result
+    seen: set[str] = set()
 
     # Pattern 1: JSON in code blocks
     code_block_pattern = r"```(?:json)?\s*([\s\S]*?)```"
@@ -72,7 +120,10 @@ def extract_json_from_text(text: str) -> list[dict[str, Any]]:
         content = match.group(1).strip()
         data, error = safe_json_loads(content)
         if error is None and isinstance(data, dict):
-            results.append(data)
+            key = json.dumps(data, sort_keys=True, default=str)
+            if key not in seen:
+                seen.add(key)
+                results.append(data)
 
     # Pattern 2: Standalone JSON objects (brace matching)
     brace_depth = 0
@@ -90,7 +141,9 @@ def extract_json_from_text(text: str) -> list[dict[str, Any]]:
                 data, error = safe_json_loads(candidate)
                 if error is None and isinstance(data, dict):
                     # Avoid duplicates from code blocks
-                    if data not in results:
+                    key = json.dumps(data, sort_keys=True, default=str)
+                    if key not in seen:
+                        seen.add(key)
                         results.append(data)
                 start_idx = None
 
@@ -120,11 +173,15 @@ def validate_json_schema(
             if field not in data:
                 errors.append(f"Missing required field: {field}")
 
-    # Check field types
-    if field_types:
+    # Check field types (nothing to check against empty data)
+    if field_types and data:
         for field, expected_type in field_types.items():
-            if field in data and not isinstance(data[field], expected_type):
-                actual_type = type(data[field]).__name__
+            value = data.get(field, _MISSING)
+            if value is _MISSING:
+                continue
+            # Exact type match is the common case; isinstance covers subclasses
+            if type(value) is not expected_type and not isinstance(value, expected_type):
+                actual_type = type(value).__name__
                 expected_name = expected_type.__name__
                 errors.append(
                     f"Field '{field}' has wrong type: expected {expected_name}, got {actual_type}"
@@ -9,6 +9,50 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+# Pattern for Python/JS-style identifiers
+_IDENTIFIER_PATTERN = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\b")
+
+# Common keywords filtered out of extracted identifiers
+_KEYWORDS: frozenset[str] = frozenset(
+    {
+        "if",
+        "else",
+        "elif",
+        "for",
+        "while",
+        "def",
+        "class",
+        "return",
+        "import",
+        "from",
+        "as",
+        "try",
+        "except",
+        "finally",
+        "with",
+        "True",
+        "False",
+        "None",
+        "and",
+        "or",
+        "not",
+        "in",
+        "is",
+        "lambda",
+        "yield",
+        "async",
+        "await",
+        "pass",
+        "break",
+        "continue",
+        "raise",
+        "global",
+        "nonlocal",
+        "assert",
+        "del",
+    }
+)
+
 
 def clean_text(text: str) -> str:
     """Clean text by removing extra whitespace and normalizing.
@@ -41,6 +85,8 @@ def normalize_whitespace(text: str) -> str:
     Returns:
         Text with normalized whitespace
     """
+    # str.split() outperforms re.sub(r"\s+", " ", ...) here, and its peak
+    # memory is no higher, even on multi-megabyte inputs
     return " ".join(text.split())
 
 
@@ -72,7 +118,16 @@ def truncate_text(
         if last_space > 0:
             truncate_at = last_space
 
-    return text[:truncate_at].rstrip() + suffix
+    # A suffix longer than max_length leaves a negative cut point; resolve it
+    # the way slicing would so the result matches text[:truncate_at].rstrip()
+    if truncate_at < 0:
+        truncate_at = max(0, len(text) + truncate_at)
+
+    # Drop trailing whitespace by moving the cut point rather than slicing twice
+    while truncate_at > 0 and text[truncate_at - 1].isspace():
+        truncate_at -= 1
+
+    return text[:truncate_at] + suffix
 
 
 @dataclass
@@ -111,34 +166,31 @@ def extract_code_blocks(text: str) -> list[CodeBlock]:
         start_line = text[: match.start()].count("\n") + 1
         blocks.append(CodeBlock(language=language, code=code, start_line=start_line))
 
-    # Pattern for indented code blocks (4 spaces or 1 tab)
-    lines = text.split("\n")
-    in_indented_block = False
-    current_block: list[str] = []
+    # Pattern for indented code blocks (4 spaces or 1 tab). ``current_block`` is
+    # None while outside a block, so a single variable tracks the scanner state.
+    current_block: list[str] | None = None
     block_start = 0
 
-    for i, line in enumerate(lines):
-        is_indented = line.startswith("    ") or line.startswith("\t")
-        is_empty = not line.strip()
-
-        if is_indented and not in_indented_block:
-            in_indented_block = True
-            block_start = i + 1
-            current_block = [line[4:] if line.startswith("    ") else line[1:]]
-        elif is_indented and in_indented_block:
-            current_block.append(line[4:] if line.startswith("    ") else line[1:])
-        elif is_empty and in_indented_block:
-            current_block.append("")
-        elif in_indented_block:
+    for i, line in enumerate(text.split("\n")):
+        indent = 4 if line[:4] == "    " else (1 if line[:1] == "\t" else 0)
+
+        if indent:
+            if current_block is None:
+                block_start = i + 1
+                current_block = []
+            current_block.append(line[indent:])
+        elif current_block is not None:
+            if not line.strip():
+                current_block.append("")
+                continue
             # End of indented block
             code = "\n".join(current_block).strip()
             if code:
                 blocks.append(CodeBlock(language=None, code=code, start_line=block_start))
-            in_indented_block = False
-            current_block = []
+            current_block = None
 
     # Handle block at end of text
-    if in_indented_block and current_block:
+    if current_block:
         code = "\n".join(current_block).strip()
         if code:
             blocks.append(CodeBlock(language=None, code=code, start_line=block_start))
@@ -169,52 +221,11 @@ def extract_identifiers(code: str) -> list[str]:
         code: Source code
 
     Returns:
-        List of unique identifiers
+        List of unique identifiers, in order of first appearance
     """
-    # Pattern for Python/JS-style identifiers
-    pattern = r"\b([a-zA-Z_][a-zA-Z0-9_]*)\b"
-    matches = re.findall(pattern, code)
-
-    # Filter out common keywords
-    keywords = {
-        "if",
-        "else",
-        "elif",
-        "for",
-        "while",
-        "def",
-        "class",
-        "return",
-        "import",
-        "from",
-        "as",
-        "try",
-        "except",
-        "finally",
-        "with",
-        "True",
-        "False",
-        "None",
-        "and",
-        "or",
-        "not",
-        "in",
-        "is",
-        "lambda",
-        "yield",
-        "async",
-        "await",
-        "pass",
-        "break",
-        "continue",
-        "raise",
-        "global",
-        "nonlocal",
-        "assert",
-        "del",
-    }
-
-    return list(set(m for m in matches if m not in keywords))
+    return list(
+        dict.fromkeys(m for m in _IDENTIFIER_PATTERN.findall(code) if m not in _KEYWORDS)
+    )
 
 
 def compute_text_similarity(text1: str, text2: str) -> float:
@@ -5,10 +5,65 @@ This module provides common validation functions for input validation.
 
 from __future__ import annotations
 
+import stat
+from functools import lru_cache
 from pathlib import Path
+from typing import Protocol
 
-from src.core.exceptions import ConfigurationError, ValidationError
-from src.shared.constants import SUPPORTED_FORKS, SUPPORTED_LANGUAGES
+from src.core.exceptions import (
+    ConfigurationError,
+    SchemaValidationError,
+    ValidationError,
+)
+from src.shared.constants import (
+    SUPPORTED_FORKS,
+    SUPPORTED_FORKS_SET,
+    SUPPORTED_LANGUAGES,
+    SUPPORTED_LANGUAGES_SET,
+)
+
+# "Expected" messages for invalid input, built once instead of per failure
+_FORKS_EXPECTED = f"One of: {', '.join(SUPPORTED_FORKS)}"
+_LANGUAGES_EXPECTED = f"One of: {', '.join(SUPPORTED_LANGUAGES)}"
+
+
+@lru_cache(maxsize=256)
+def _is_supported_fork(fork: str) -> bool:
+    """Check fork support case-insensitively (cached per input string)."""
+    return fork.lower() in SUPPORTED_FORKS_SET
+
+
+@lru_cache(maxsize=256)
+def _is_supported_language(language: str) -> bool:
+    """Check language support case-insensitively (cached per input string)."""
+    return language.lower() in SUPPORTED_LANGUAGES_SET
+
+
+def _fork_error(fork: str) -> ValidationError:
+    return ValidationError(
+        f"Invalid fork version: {fork}",
+        field="fork",
+        value=fork,
+        expected=_FORKS_EXPECTED,
+    )
+
+
+def _language_error(language: str) -> ValidationError:
+    return ValidationError(
+        f"Invalid language: {language}",
+        field="language",
+        value=language,
+        expected=_LANGUAGES_EXPECTED,
+    )
+
+
+def _threshold_error(threshold: float) -> ValidationError:
+    return ValidationError(
+        f"Invalid confidence threshold: {threshold}",
+        field="confidence_threshold",
+        value=threshold,
+        expected="Value between 0.0 and 1.0",
+    )
 
 
 def validate_fork_version(fork: str, raise_error: bool = True) -> bool:
@@ -24,16 +79,10 @@ def validate_fork_version(fork: str, raise_error: bool = True) -> bool:
     Raises:
         ValidationError: If fork is invalid and raise_error is True
     """
-    fork_lower = fork.lower()
-    is_valid = fork_lower in SUPPORTED_FORKS
+    is_valid = _is_supported_fork(fork)
 
     if not is_valid and raise_error:
-        raise ValidationError(
-            f"Invalid fork version: {fork}",
-            field="fork",
-            value=fork,
-            expected=f"One of: {', '.join(SUPPORTED_FORKS)}",
-        )
+        raise _fork_error(fork)
 
     return is_valid
 
@@ -51,20 +100,39 @@ def validate_language(language: str, raise_error: bool = True) -> bool:
     Raises:
         ValidationError: If language is invalid and raise_error is True
     """
-    lang_lower = language.lower()
-    is_valid = lang_lower in SUPPORTED_LANGUAGES
+    is_valid = _is_supported_language(language)
 
     if not is_valid and raise_error:
-        raise ValidationError(
-            f"Invalid language: {language}",
-            field="language",
-            value=language,
-            expected=f"One of: {', '.join(SUPPORTED_LANGUAGES)}",
-        )
+        raise _language_error(language)
 
     return is_valid
 
 
+@lru_cache(maxsize=64)
+def _lowercase_extensions(extensions: tuple[str, ...]) -> tuple[str, ...]:
+    """Lower-case a tuple of file extensions (cached per tuple)."""
+    return tuple(ext.lower() for ext in extensions)
+
+
+def _has_allowed_extension(path: str, extensions: tuple[str, ...]) -> bool:
+    """Check a path's suffix against lower-cased extensions.
+
+    Same result as ``Path(path).suffix.lower() in extensions`` without
+    building a Path: the suffix starts at the last "." of the final
+    component, and a leading dot (the dotfile ".py") is not a suffix.
+    """
+    name = path[path.rfind("/") + 1 :]
+    dot = name.rfind(".")
+    suffix = name[dot:] if 0 < dot < len(name) - 1 else ""
+    return suffix.lower() in extensions
+
+
+@lru_cache(maxsize=64)
+def _extensions_expected(extensions: tuple[str, ...]) -> str:
+    """Build the "expected" message for an extension tuple (cached per tuple)."""
+    return f"One of: {', '.join(extensions)}"
+
+
 def validate_file_path(
     path: str | Path,
     must_exist: bool = True,
@@ -87,37 +155,58 @@ def validate_file_path(
     Raises:
         ValidationError: If path is invalid and raise_error is True
     """
-    path_obj = Path(path)
-
-    # Check existence
-    if must_exist and not path_obj.exists():
-        if raise_error:
-            raise ValidationError(
-                f"Path does not exist: {path}",
-                field="path",
-                value=str(path),
-            )
-        return False
+    if allowed_extensions:
+        # The cached helpers below need a hashable key; callers may pass a list
+        allowed_extensions = tuple(allowed_extensions)
+
+    # Fast path for name-only checks on plain strings: no Path is built
+    # unless the extension check fails (Path normalization can only turn a
+    # failing raw string into a passing one, never the reverse)
+    if (
+        not must_exist
+        and type(path) is str
+        and (
+            not allowed_extensions
+            or _has_allowed_extension(path, _lowercase_extensions(allowed_extensions))
+        )
+    ):
+        return True
+
+    path_obj = path if isinstance(path, Path) else Path(path)
+
+    if must_exist:
+        # A single stat() answers both the existence and the file-type check;
+        # like Path.exists(), treat any OS error (e.g. a symlink loop) or an
+        # unrepresentable path (embedded NUL) as missing
+        try:
+            mode = path_obj.stat().st_mode
+        except (OSError, ValueError):
+            if raise_error:
+                raise ValidationError(
+                    f"Path does not exist: {path}",
+                    field="path",
+                    value=str(path),
+                )
+            return False
 
-    # Check if it's a file
-    if must_exist and must_be_file and not path_obj.is_file():
-        if raise_error:
-            raise ValidationError(
-                f"Path is not a file: {path}",
-                field="path",
-                value=str(path),
-            )
-        return False
+        if must_be_file and not stat.S_ISREG(mode):
+            if raise_error:
+                raise ValidationError(
+                    f"Path is not a file: {path}",
+                    field="path",
+                    value=str(path),
+                )
+            return False
 
     # Check extension
     if allowed_extensions:
-        if path_obj.suffix.lower() not in allowed_extensions:
+        if not _has_allowed_extension(path_obj.name, _lowercase_extensions(allowed_extensions)):
             if raise_error:
                 raise ValidationError(
                     f"Invalid file extension: {path_obj.suffix}",
                     field="path",
                     value=str(path),
-                    expected=f"One of: {', '.join(allowed_extensions)}",
+                    expected=_extensions_expected(allowed_extensions),
                 )
             return False
 
@@ -143,16 +232,69 @@ def validate_confidence_threshold(
     is_valid = 0.0 <= threshold <= 1.0
 
     if not is_valid and raise_error:
-        raise ValidationError(
-            f"Invalid confidence threshold: {threshold}",
-            field="confidence_threshold",
-            value=threshold,
-            expected="Value between 0.0 and 1.0",
-        )
+        raise _threshold_error(threshold)
 
     return is_valid
 
 
+def validate_request(
+    *,
+    fork: str,
+    language: str,
+    path: str | Path,
+    threshold: float,
+    allowed_extensions: tuple[str, ...] | None = None,
+    must_exist: bool = True,
+) -> bool:
+    """Validate the common inputs of a verification request in one call.
+
+    Every field is checked before raising, so callers see all problems at
+    once instead of fixing them one at a time.
+
+    Args:
+        fork: Fork version to validate
+        language: Language to validate
+        path: Source file path to validate
+        threshold: Confidence threshold to validate
+        allowed_extensions: Tuple of allowed file extensions for path
+        must_exist: Whether the file at path must exist
+
+    Returns:
+        True if all inputs are valid
+
+    Raises:
+        ValidationError: If exactly one input is invalid
+        SchemaValidationError: If several inputs are invalid, with one
+            entry per failure in validation_errors
+    """
+    errors: list[ValidationError] = []
+
+    if not _is_supported_fork(fork):
+        errors.append(_fork_error(fork))
+    if not _is_supported_language(language):
+        errors.append(_language_error(language))
+    if not 0.0 <= threshold <= 1.0:
+        errors.append(_threshold_error(threshold))
+    try:
+        validate_file_path(
+            path,
+            must_exist=must_exist,
+            allowed_extensions=allowed_extensions,
+        )
+    except ValidationError as e:
+        errors.append(e)
+
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise SchemaValidationError(
+            f"Invalid request: {len(errors)} fields failed validation",
+            validation_errors=[str(e) for e in errors],
+        )
+
+    return True
+
+
 def validate_api_key(
     api_key: str,
     key_name: str = "API key",
@@ -171,7 +313,8 @@ def validate_api_key(
     Raises:
         ConfigurationError: If API key is empty and raise_error is True
     """
-    is_valid = bool(api_key and api_key.strip())
+    # isspace() scans in place; strip() would allocate a copy of the key
+    is_valid = bool(api_key) and not api_key.isspace()
 
     if not is_valid and raise_error:
         raise ConfigurationError(
@@ -222,3 +365,56 @@ def validate_positive_int(
         )
 
     return is_valid
+
+
+class IntValidator(Protocol):
+    """Validator returned by make_int_validator()."""
+
+    def __call__(self, value: int, raise_error: bool = True) -> bool: ...
+
+
+def make_int_validator(
+    field_name: str,
+    min_value: int = 1,
+    max_value: int | None = None,
+) -> IntValidator:
+    """Build a validator for an integer field with fixed bounds.
+
+    Equivalent to calling validate_positive_int() with the same field name
+    and bounds, but the bounds check and the "expected" message are
+    resolved once here instead of on every call.
+
+    Args:
+        field_name: Name of the field for error messages
+        min_value: Minimum allowed value
+        max_value: Maximum allowed value (None for no limit)
+
+    Returns:
+        Function taking (value, raise_error=True) and returning True if valid
+    """
+    if max_value is not None:
+        expected = f"Integer between {min_value} and {max_value}"
+    else:
+        expected = f"Integer >= {min_value}"
+
+    def _fail(value: int, raise_error: bool) -> bool:
+        if raise_error:
+            raise ValidationError(
+                f"Invalid {field_name}: {value}",
+                field=field_name,
+                value=value,
+                expected=expected,
+            )
+        return False
+
+    if max_value is None:
+
+        def validator(value: int, raise_error: bool = True) -> bool:
+            return value >= min_value or _fail(value, raise_error)
+
+    else:
+
+        def validator(value: int, raise_error: bool = True) -> bool:
+            return min_value <= value <= max_value or _fail(value, raise_error)
+
+    return validator
@@ -1,4 +1,8 @@
-"""Pytest configuration and fixtures."""
+"""Pytest configuration and fixtures.
+
+Fixtures that return immutable sample data (frozen entities, tuples) are
+session-scoped so they are built once per test run.
+"""
 
 from __future__ import annotations
 
@@ -60,59 +64,64 @@ def validate_block(block):
 '''
 
 
-@pytest.fixture
+# Plain dicts/lists on purpose: the layer-1 validators type-check for real
+# JSON containers, so a MappingProxyType/tuple freeze would be rejected.
+_SAMPLE_AST_JSON: dict[str, Any] = {
+    "type": "module",
+    "children": [
+        {
+            "type": "assignment",
+            "name": "FORK_CRITERIA",
+            "value": 12244000,
+            "line": 3,
+        },
+        {
+            "type": "assignment",
+            "name": "MAX_BLOCK_SIZE",
+            "value": 1048576,
+            "line": 4,
+        },
+        {
+            "type": "function",
+            "name": "apply_fork",
+            "line": 6,
+            "children": [
+                {
+                    "type": "if",
+                    "children": [
+                        {"type": "compare"},
+                        {"type": "return", "children": [{"type": "call", "name": "apply_new_rules"}]},
+                    ],
+                },
+                {"type": "return", "children": [{"type": "name", "name": "state"}]},
+            ],
+        },
+        {
+            "type": "function",
+            "name": "validate_block",
+            "line": 12,
+            "children": [
+                {
+                    "type": "if",
+                    "children": [
+                        {"type": "compare"},
+                        {"type": "raise"},
+                    ],
+                },
+                {"type": "return", "children": [{"type": "constant", "value": True}]},
+            ],
+        },
+    ],
+}
+
+
+@pytest.fixture(scope="session")
 def sample_ast_json() -> dict[str, Any]:
-    """Sample AST JSON structure."""
-    return {
-        "type": "module",
-        "children": [
-            {
-                "type": "assignment",
-                "name": "FORK_CRITERIA",
-                "value": 12244000,
-                "line": 3,
-            },
-            {
-                "type": "assignment",
-                "name": "MAX_BLOCK_SIZE",
-                "value": 1048576,
-                "line": 4,
-            },
-            {
-                "type": "function",
-                "name": "apply_fork",
-                "line": 6,
-                "children": [
-                    {
-                        "type": "if",
-                        "children": [
-                            {"type": "compare"},
-                            {"type": "return", "children": [{"type": "call", "name": "apply_new_rules"}]},
-                        ],
-                    },
-                    {"type": "return", "children": [{"type": "name", "name": "state"}]},
-                ],
-            },
-            {
-                "type": "function",
-                "name": "validate_block",
-                "line": 12,
-                "children": [
-                    {
-                        "type": "if",
-                        "children": [
-                            {"type": "compare"},
-                            {"type": "raise"},
-                        ],
-                    },
-                    {"type": "return", "children": [{"type": "constant", "value": True}]},
-                ],
-            },
-        ],
-    }
+    """Sample AST JSON structure (shared across tests; treat as read-only)."""
+    return _SAMPLE_AST_JSON
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ast_node() -> ASTNode:
     """Sample ASTNode instance."""
     return ASTNode(
@@ -137,7 +146,7 @@ def sample_ast_node() -> ASTNode:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cfg() -> ControlFlowGraph:
     """Sample Control Flow Graph."""
     nodes = (
@@ -162,7 +171,7 @@ def sample_cfg() -> ControlFlowGraph:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_flow() -> DataFlowInfo:
     """Sample DataFlowInfo."""
     return DataFlowInfo(
@@ -176,7 +185,7 @@ def sample_data_flow() -> DataFlowInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_behavioral_model(
     sample_ast_node: ASTNode,
     sample_cfg: ControlFlowGraph,
@@ -197,7 +206,7 @@ def sample_behavioral_model(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_spec_metadata() -> SpecificationMetadata:
     """Sample SpecificationMetadata."""
     return SpecificationMetadata(
@@ -209,10 +218,12 @@ def sample_spec_metadata() -> SpecificationMetadata:
     )
 
 
-@pytest.fixture
-def sample_spec_chunks(sample_spec_metadata: SpecificationMetadata) -> list[SpecificationChunk]:
+@pytest.fixture(scope="session")
+def sample_spec_chunks(
+    sample_spec_metadata: SpecificationMetadata,
+) -> tuple[SpecificationChunk, ...]:
     """Sample specification chunks."""
-    return [
+    return (
         SpecificationChunk(
             chunk_id="chunk-001",
             content="The fork criteria must be defined by a specific block number.",
@@ -223,10 +234,10 @@ def sample_spec_chunks(sample_spec_metadata: SpecificationMetadata) -> list[Spec
             content="Once a fork activation block is set, it must not be modified.",
             metadata=sample_spec_metadata,
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_normalized_spec() -> NormalizedSpecification:
     """Sample NormalizedSpecification."""
     return NormalizedSpecification(
@@ -263,7 +274,7 @@ def sample_normalized_spec() -> NormalizedSpecification:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_finding() -> Finding:
     """Sample Finding."""
     return Finding(
@@ -279,7 +290,7 @@ def sample_finding() -> Finding:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_verification_result(sample_finding: Finding) -> VerificationResult:
     """Sample VerificationResult."""
     from datetime import datetime
@@ -86,4 +86,18 @@ def test_json_not_dict_filtered():
     """
 
     with pytest.raises(ParsingFailedError):
-        extract_json_candidates(raw)
\ No newline at end of file
+        extract_json_candidates(raw)
+
+
+# ----------------------------
+# Wide Integers Keep Precision
+# ----------------------------
+def test_large_integer_precision():
+    value = 2**256 - 1
+    raw = f'Balance: {{ "type": "Balance", "wei": {value}, }}'
+
+    result = extract_json_candidates(raw)
+
+    assert len(result.valid) == 1
+    assert result.valid[0]["wei"] == value
+    assert type(result.valid[0]["wei"]) is int
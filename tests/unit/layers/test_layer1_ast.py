@@ -181,6 +181,14 @@ class TestCFGGenerator:
         assert "entry" in cfg_dict
         assert "exits" in cfg_dict
 
+    def test_generate_cached_per_ast(self, sample_ast_node: ASTNode) -> None:
+        """Test that the same AST object returns the cached CFG."""
+        generator = CFGGenerator()
+        cfg = generator.generate(sample_ast_node)
+
+        assert generator.generate(sample_ast_node) is cfg
+        assert generator.generate(ASTNode(node_type=NodeType.MODULE)) is not cfg
+
 
 class TestDataFlowAnalyzer:
     """Tests for DataFlowAnalyzer."""
@@ -210,6 +218,14 @@ class TestDataFlowAnalyzer:
 
         assert "apply_rules" in data_flow.function_calls
 
+    def test_analyze_cached_per_ast(self, sample_ast_node: ASTNode) -> None:
+        """Test that the same AST object returns the cached result."""
+        analyzer = DataFlowAnalyzer()
+        data_flow = analyzer.analyze(sample_ast_node)
+
+        assert analyzer.analyze(sample_ast_node) is data_flow
+        assert analyzer.analyze(ASTNode(node_type=NodeType.MODULE)) is not data_flow
+
     def test_data_flow_to_dict(self, sample_data_flow) -> None:
         """Test DataFlowInfo dictionary conversion."""
         data_dict = sample_data_flow.to_dict()
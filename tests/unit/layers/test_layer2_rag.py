@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 
 from src.core.entities.specification import (
@@ -10,9 +12,59 @@ from src.core.entities.specification import (
     SpecificationDocument,
     SpecificationMetadata,
 )
+from src.layers.layer2_rag.document_parser import DocumentParser
 from src.layers.layer2_rag.semantic_chunker import SemanticChunker
 
 
+class TestDocumentParser:
+    """Tests for DocumentParser Markdown sections."""
+
+    @pytest.fixture
+    def parse_sections(self, sample_spec_metadata: SpecificationMetadata):
+        """Return a function mapping Markdown text to its parsed sections."""
+        parser = DocumentParser()
+
+        def parse(content: str) -> dict[str, str]:
+            return parser._parse_markdown(content, sample_spec_metadata).sections
+
+        return parse
+
+    def test_heading_followed_by_heading_dropped(self, parse_sections) -> None:
+        """Test that a heading with no lines before the next one is dropped."""
+        sections = parse_sections("## Empty\n## Full\nBody text\n")
+
+        assert sections == {"full": "Body text"}
+
+    def test_heading_followed_by_blank_line_kept(self, parse_sections) -> None:
+        """Test that a blank line between headings keeps an empty section."""
+        sections = parse_sections("## Blank\n\n## Full\nBody text")
+
+        assert sections == {"blank": "", "full": "Body text"}
+
+    def test_trailing_heading(self, parse_sections) -> None:
+        """Test a final heading with and without a trailing newline."""
+        assert parse_sections("## Full\nBody\n## Last\n") == {"full": "Body", "last": ""}
+        assert parse_sections("## Full\nBody\n## Last") == {"full": "Body"}
+
+    def test_text_before_first_heading(self, parse_sections) -> None:
+        """Test that text before the first heading becomes the introduction."""
+        sections = parse_sections("Intro text\n\n# Title\nBody")
+
+        assert sections == {"introduction": "Intro text", "title": "Body"}
+
+    def test_no_headings(self, parse_sections) -> None:
+        """Test that content without headings is a single introduction."""
+        assert parse_sections("\nJust text.\nMore text.\n") == {
+            "introduction": "Just text.\nMore text."
+        }
+
+    def test_bare_hash_line_is_not_heading(self, parse_sections) -> None:
+        """Test that a lone "#" does not turn the next line into a heading."""
+        sections = parse_sections("#\nNot a heading\n## Real\nBody")
+
+        assert sections == {"introduction": "#\nNot a heading", "real": "Body"}
+
+
 class TestSemanticChunker:
     """Tests for SemanticChunker."""
 
@@ -72,6 +124,15 @@ the new rules should be applied.
             # Allow some tolerance for semantic boundaries
             assert len(chunk.content) <= chunk_size * 2
 
+    def test_chunk_cached_per_document(self, sample_document: SpecificationDocument) -> None:
+        """Test that re-chunking an unchanged document reuses the chunks."""
+        chunker = SemanticChunker(chunk_size=200)
+        chunks = chunker.chunk(sample_document)
+
+        assert chunker.chunk(sample_document) == chunks
+        assert chunker.chunk(replace(sample_document)) == chunks
+        assert SemanticChunker(chunk_size=300).chunk(sample_document) != chunks
+
     def test_requirement_type_detection(self) -> None:
         """Test requirement type detection."""
         chunker = SemanticChunker()
@@ -88,6 +149,19 @@ the new rules should be applied.
         invariant_type = chunker._detect_requirement_type("This value is always positive")
         assert invariant_type == RequirementType.INVARIANT
 
+    def test_subclass_keyword_override(self) -> None:
+        """Test that subclass keyword sets are used for detection."""
+
+        class CustomChunker(SemanticChunker):
+            INVARIANT_KEYWORDS = {"conserved"}
+
+        chunker = CustomChunker()
+
+        assert chunker._detect_requirement_type("Supply is conserved") == RequirementType.INVARIANT
+        assert chunker._detect_requirement_type("This value is always positive") == (
+            RequirementType.FUNCTIONAL
+        )
+
     def test_related_chunks_identified(self, sample_document: SpecificationDocument) -> None:
         """Test that related chunks are identified."""
         chunker = SemanticChunker(chunk_size=100)
@@ -57,6 +57,28 @@ class TestRequirementComparator:
             ComparisonResult.AMBIGUOUS,
         )
 
+    def test_compare_all(self, sample_normalized_spec, sample_behavioral_model) -> None:
+        """Test that compare_all matches the individual comparisons, in order."""
+        comparator = RequirementComparator()
+
+        details = comparator.compare_all(sample_normalized_spec, sample_behavioral_model)
+
+        expected = [
+            *(
+                comparator.compare_requirement(requirement, sample_behavioral_model)
+                for requirement in sample_normalized_spec.requirements
+            ),
+            *(
+                comparator.compare_constraint(constraint, sample_behavioral_model)
+                for constraint in sample_normalized_spec.constraints
+            ),
+            *(
+                comparator.compare_invariant(invariant, sample_behavioral_model)
+                for invariant in sample_normalized_spec.invariants
+            ),
+        ]
+        assert details == expected
+
     def test_extract_key_terms(self) -> None:
         """Test key term extraction."""
         comparator = RequirementComparator()
@@ -119,6 +141,31 @@ class TestConfidenceCalculator:
 
         assert abs(total_weight - 1.0) < 0.01
 
+    def test_weights_within_tolerance(self) -> None:
+        """Test that weights summing to 1.0 within tolerance are accepted."""
+        calculator = ConfidenceCalculator(
+            evidence_weight=0.355,
+            context_weight=0.25,
+            reasoning_weight=0.25,
+            coverage_weight=0.15,
+        )
+
+        assert calculator.evidence_weight == 0.355
+
+    def test_weights_out_of_tolerance(self) -> None:
+        """Test that weights not summing to 1.0 are rejected."""
+        from src.core.exceptions import ValidationError
+
+        with pytest.raises(ValidationError, match="must sum to 1.0") as exc_info:
+            ConfidenceCalculator(
+                evidence_weight=0.5,
+                context_weight=0.25,
+                reasoning_weight=0.25,
+                coverage_weight=0.15,
+            )
+
+        assert exc_info.value.field == "weights"
+
     def test_high_confidence_for_strong_evidence(self, sample_finding) -> None:
         """Test that strong evidence produces high confidence."""
         from src.core.interfaces.vector_store import SearchResult
@@ -135,6 +182,37 @@ class TestConfidenceCalculator:
 
         assert confidence.score >= 0.6  # Should be reasonably high
 
+    def test_calculate_many_matches_calculate(self, sample_finding) -> None:
+        """Test that batch scoring matches scoring each finding on its own."""
+        from dataclasses import replace
+
+        from src.core.interfaces.vector_store import SearchResult
+
+        calculator = ConfidenceCalculator()
+
+        findings = [
+            sample_finding,
+            replace(sample_finding, finding_id="F-002", evidence=()),
+        ]
+        evidences = [
+            [SearchResult(chunk_id="chunk-1", content="Spec text", score=0.9, metadata={})],
+            [],
+        ]
+
+        scores = calculator.calculate_many(findings, evidences)
+
+        assert scores == [
+            calculator.calculate(finding, evidence)
+            for finding, evidence in zip(findings, evidences)
+        ]
+
+    def test_calculate_many_length_mismatch(self, sample_finding) -> None:
+        """Test that findings and evidences must have the same length."""
+        calculator = ConfidenceCalculator()
+
+        with pytest.raises(ValueError):
+            calculator.calculate_many([sample_finding, sample_finding], [[]])
+
 
 class TestReportGenerator:
     """Tests for JSONReportGenerator."""
@@ -190,3 +268,28 @@ class TestReportGenerator:
         assert "$schema" in sarif
         assert "runs" in sarif
         assert len(sarif["runs"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_matches_json_report(self, sample_verification_result) -> None:
+        """Test that the streamed JSON report matches the generated one."""
+        from dataclasses import replace
+
+        from src.core.interfaces.report_generator import ReportFormat
+        from src.layers.layer3_cot.report_generator import JSONReportGenerator
+
+        generator = JSONReportGenerator()
+        findings = sample_verification_result.findings
+
+        for result in (
+            sample_verification_result,
+            replace(sample_verification_result, findings=()),
+            replace(sample_verification_result, findings=findings * 3),
+            replace(
+                sample_verification_result,
+                findings=(replace(findings[0], title="Übergang — fork"),),
+            ),
+        ):
+            report = await generator.generate(result, ReportFormat.JSON)
+            streamed = "".join([chunk async for chunk in generator.stream(result)])
+
+            assert streamed == report
@@ -0,0 +1 @@
+"""Shared module unit tests."""
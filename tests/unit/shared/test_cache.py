@@ -0,0 +1,66 @@
+"""Unit tests for cache utilities."""
+
+from __future__ import annotations
+
+from src.shared.utils.cache import FIFOCache, IdentityCache
+
+
+class TestFIFOCache:
+    """Tests for FIFOCache."""
+
+    def test_get_and_put(self) -> None:
+        """Test that stored values are returned and missing keys give None."""
+        cache: FIFOCache[str, int] = FIFOCache()
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_evicts_oldest_entry(self) -> None:
+        """Test that the first inserted key is evicted once full."""
+        cache: FIFOCache[str, int] = FIFOCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_overwrite_does_not_evict(self) -> None:
+        """Test that re-storing an existing key keeps the other entries."""
+        cache: FIFOCache[str, int] = FIFOCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("b", 3)
+
+        assert len(cache) == 2
+        assert cache.get("a") == 1
+        assert cache.get("b") == 3
+
+
+class TestIdentityCache:
+    """Tests for IdentityCache."""
+
+    def test_keyed_by_identity(self) -> None:
+        """Test that equal but distinct objects get separate entries."""
+        cache: IdentityCache[list[int], str] = IdentityCache()
+        first = [1]
+        second = [1]
+        cache.put(first, "first")
+
+        assert cache.get(first) == "first"
+        assert cache.get(second) is None
+
+    def test_evicts_oldest_entry(self) -> None:
+        """Test that the oldest object is evicted once full."""
+        cache: IdentityCache[list[int], int] = IdentityCache(maxsize=2)
+        keys = [[0], [1], [2]]
+        for i, key in enumerate(keys):
+            cache.put(key, i)
+
+        assert len(cache) == 2
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[1]) == 1
+        assert cache.get(keys[2]) == 2
@@ -0,0 +1,97 @@
+"""Unit tests for configuration loading."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.shared import config
+from src.shared.config import Settings, reload_settings, snapshot_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def env_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Run in an empty directory with fresh settings caches."""
+    monkeypatch.chdir(tmp_path)
+    for name in ("PORT", "WORKERS", "DEBUG", "GEMINI_MODEL", "NEO4J_USER"):
+        monkeypatch.delenv(name, raising=False)
+    config._read_env_file.cache_clear()
+    config.get_settings.cache_clear()
+    yield tmp_path
+    config._read_env_file.cache_clear()
+    config.get_settings.cache_clear()
+
+
+class TestSettingsSources:
+    """Tests for the settings source precedence."""
+
+    def test_env_var_beats_env_file_beats_default(
+        self, env_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that environment variables override .env, which overrides defaults."""
+        (env_dir / ".env").write_text("PORT=9000\nWORKERS=8\n")
+        monkeypatch.setenv("PORT", "9100")
+
+        settings = Settings()
+
+        assert settings.port == 9100
+        assert settings.workers == 8
+        assert settings.host == "0.0.0.0"
+
+    def test_env_file_only_value(self, env_dir: Path) -> None:
+        """Test that a value present only in .env is used.
+
+        Guards the override of EnvSettingsSource._load_env_vars: if
+        pydantic-settings stops calling it, .env values are ignored.
+        """
+        (env_dir / ".env").write_text("DEBUG=true\n")
+
+        assert Settings().debug is True
+
+    def test_prefixed_nested_value_from_env_file(self, env_dir: Path) -> None:
+        """Test that nested settings read their prefixed keys from .env."""
+        (env_dir / ".env").write_text("GEMINI_MODEL=gemini-test\nNEO4J_USER=admin\n")
+
+        settings = Settings()
+
+        assert settings.llm.model == "gemini-test"
+        assert settings.knowledge_graph.user == "admin"
+
+    def test_missing_env_file_uses_defaults(self, env_dir: Path) -> None:
+        """Test that defaults apply when there is no .env file."""
+        settings = Settings()
+
+        assert settings.port == 8000
+        assert settings.llm.model == "gemini-2.5-flash"
+
+
+class TestSettingsCache:
+    """Tests for cached settings helpers."""
+
+    def test_reload_settings_rereads_env_file(self, env_dir: Path) -> None:
+        """Test that reload_settings() picks up an edited .env file."""
+        env_file = env_dir / ".env"
+        env_file.write_text("WORKERS=2\n")
+        assert config.get_settings().workers == 2
+
+        env_file.write_text("WORKERS=6\n")
+        assert config.get_settings().workers == 2
+        assert reload_settings().workers == 6
+
+    def test_snapshot_settings_is_independent_copy(self, env_dir: Path) -> None:
+        """Test that snapshot_settings() returns an equal but separate copy."""
+        cached = config.get_settings()
+
+        snapshot = snapshot_settings()
+
+        assert snapshot == cached
+        assert snapshot is not cached
+        assert snapshot.llm is not cached.llm
+
+        snapshot.llm.model = "changed"
+        assert cached.llm.model == "gemini-2.5-flash"
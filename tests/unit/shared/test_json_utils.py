@@ -0,0 +1,76 @@
+"""Unit tests for JSON utilities."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from src.shared.utils import json_utils
+from src.shared.utils.json_utils import (
+    extract_json_from_text,
+    fast_json_loads,
+    safe_json_dumps,
+    safe_json_loads,
+)
+
+UINT256_MAX = 2**256 - 1
+
+
+@pytest.fixture(params=[False, True], ids=["stdlib", "orjson"])
+def json_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run a test with and without the optional orjson parser."""
+    use_orjson = request.param
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(json_utils, "_HAS_ORJSON", use_orjson)
+    return use_orjson
+
+
+class TestFastJsonLoads:
+    """Tests for fast_json_loads / safe_json_loads."""
+
+    def test_large_integers_keep_precision(self, json_backend: bool) -> None:
+        """Test that integers wider than 64 bits are not turned into floats."""
+        for value in (2**64, 2**64 + 1, UINT256_MAX):
+            data = fast_json_loads(f'{{"wei": {value}}}')
+
+            assert data["wei"] == value
+            assert type(data["wei"]) is int
+
+    def test_extract_large_integer_from_text(self, json_backend: bool) -> None:
+        """Test that extracted objects keep uint256 values exact."""
+        results = extract_json_from_text(f'Result: {{"wei": {UINT256_MAX}}} done')
+
+        assert results == [{"wei": UINT256_MAX}]
+
+    def test_stdlib_only_values_accepted(self, json_backend: bool) -> None:
+        """Test that NaN, Infinity and huge floats parse as with json.loads."""
+        data = fast_json_loads('{"a": NaN, "b": Infinity, "c": 1e400}')
+
+        assert math.isnan(data["a"])
+        assert data["b"] == math.inf
+        assert data["c"] == math.inf
+
+    def test_invalid_json_reports_error(self, json_backend: bool) -> None:
+        """Test that invalid JSON yields an error message, not an exception."""
+        data, error = safe_json_loads('{"a": }')
+
+        assert data is None
+        assert error is not None
+        assert "position 6" in error
+
+
+class TestSafeJsonDumps:
+    """Tests for safe_json_dumps."""
+
+    def test_output_matches_stdlib_format(self) -> None:
+        """Test separators, datetimes and floats use the stdlib formatting."""
+        from datetime import datetime
+
+        data = {"a": 1, "t": datetime(2024, 1, 2, 3, 4, 5), "f": 1e16}
+
+        assert safe_json_dumps(data, indent=None) == (
+            '{"a": 1, "t": "2024-01-02 03:04:05", "f": 1e+16}'
+        )
+        assert safe_json_dumps({"n": math.nan}, indent=None) == '{"n": NaN}'
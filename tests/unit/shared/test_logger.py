@@ -0,0 +1,39 @@
+"""Unit tests for logging setup."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import pytest
+
+from src.shared import logger as logger_module
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        [
+            ("debug", logging.DEBUG),
+            ("INFO", logging.INFO),
+            ("warn", logging.WARNING),
+            ("Warning", logging.WARNING),
+            ("fatal", logging.CRITICAL),
+            ("notset", logging.NOTSET),
+        ],
+    )
+    def test_level_names(
+        self, level: str, expected: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that every name logging accepts, aliases included, resolves."""
+        configured: dict[str, Any] = {}
+        monkeypatch.setattr(
+            logging, "basicConfig", lambda **kwargs: configured.update(kwargs)
+        )
+        monkeypatch.setattr(logger_module.structlog, "configure", lambda **kwargs: None)
+
+        logger_module.setup_logging(level)
+
+        assert configured["level"] == expected
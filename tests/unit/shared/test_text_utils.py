@@ -0,0 +1,88 @@
+"""Unit tests for text utilities."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.shared.utils.text_utils import CodeBlock, extract_code_blocks, truncate_text
+
+
+class TestTruncateText:
+    """Tests for truncate_text."""
+
+    def test_short_text_unchanged(self) -> None:
+        """Test that text within the limit is returned as is."""
+        assert truncate_text("short", 10) == "short"
+
+    def test_word_boundary(self) -> None:
+        """Test truncation at the last space before the limit."""
+        assert truncate_text("the quick brown fox", 13) == "the quick..."
+
+    def test_suffix_longer_than_limit(self) -> None:
+        """Test that trailing whitespace is stripped for a negative cut point."""
+        assert truncate_text("a \t\nab\n\n ", 1, word_boundary=False) == "a \t\nab..."
+
+    @pytest.mark.parametrize("max_length", range(0, 12))
+    @pytest.mark.parametrize("word_boundary", [True, False])
+    def test_matches_slice_and_rstrip(self, max_length: int, word_boundary: bool) -> None:
+        """Test equivalence with slicing then rstrip() for every length."""
+        text = "a  b \t c\n\n d  "
+        truncate_at = max_length - 3
+        if word_boundary:
+            last_space = text.rfind(" ", 0, truncate_at)
+            if last_space > 0:
+                truncate_at = last_space
+
+        assert truncate_text(text, max_length, word_boundary=word_boundary) == (
+            text[:truncate_at].rstrip() + "..."
+        )
+
+
+class TestExtractCodeBlocks:
+    """Tests for extract_code_blocks indented blocks."""
+
+    def test_four_space_block(self) -> None:
+        """Test a block indented with four spaces."""
+        text = "Intro\n    x = 1\n      y = 2\nAfter"
+
+        assert extract_code_blocks(text) == [
+            CodeBlock(language=None, code="x = 1\n  y = 2", start_line=2)
+        ]
+
+    def test_tab_block(self) -> None:
+        """Test a block indented with a tab."""
+        text = "Intro\n\tx = 1\n\t\ty = 2\nAfter"
+
+        assert extract_code_blocks(text) == [
+            CodeBlock(language=None, code="x = 1\n\ty = 2", start_line=2)
+        ]
+
+    def test_blank_line_continues_block(self) -> None:
+        """Test that blank lines inside a block do not end it."""
+        text = "Intro\n    a = 1\n\n   \n    b = 2\nAfter\n"
+
+        assert extract_code_blocks(text) == [
+            CodeBlock(language=None, code="a = 1\n\n\nb = 2", start_line=2)
+        ]
+
+    def test_block_at_end_of_text(self) -> None:
+        """Test that a block running to the end of text is kept."""
+        text = "Intro\n\n    a = 1\n    b = 2\n\n"
+
+        assert extract_code_blocks(text) == [
+            CodeBlock(language=None, code="a = 1\nb = 2", start_line=3)
+        ]
+
+    def test_start_lines_of_several_blocks(self) -> None:
+        """Test start_line for fenced and consecutive indented blocks."""
+        text = "```py\nfenced()\n```\nText\n    first()\nText\n\n\tsecond()\n"
+
+        assert extract_code_blocks(text) == [
+            CodeBlock(language="py", code="fenced()", start_line=1),
+            CodeBlock(language=None, code="first()", start_line=5),
+            CodeBlock(language=None, code="second()", start_line=8),
+        ]
+
+    def test_three_spaces_is_not_code(self) -> None:
+        """Test that fewer than four spaces do not start a block."""
+        assert extract_code_blocks("Intro\n   not code\n") == []
@@ -0,0 +1,201 @@
+"""Unit tests for validation utilities."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import SchemaValidationError, ValidationError
+from src.shared.utils.validation import (
+    make_int_validator,
+    validate_file_path,
+    validate_positive_int,
+    validate_request,
+)
+
+
+class TestValidateFilePath:
+    """Tests for validate_file_path."""
+
+    def test_existing_file(self, tmp_path: Path) -> None:
+        """Test that an existing file passes."""
+        source = tmp_path / "contract.py"
+        source.write_text("x = 1\n")
+
+        assert validate_file_path(source) is True
+        assert validate_file_path(str(source)) is True
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test that a missing file fails."""
+        missing = tmp_path / "missing.py"
+
+        assert validate_file_path(missing, raise_error=False) is False
+        with pytest.raises(ValidationError, match="does not exist"):
+            validate_file_path(missing)
+
+    def test_directory_is_not_file(self, tmp_path: Path) -> None:
+        """Test that a directory fails when a file is required."""
+        assert validate_file_path(tmp_path, raise_error=False) is False
+        assert validate_file_path(tmp_path, must_be_file=False) is True
+
+    def test_symlink_loop_treated_as_missing(self, tmp_path: Path) -> None:
+        """Test that a symlink loop fails instead of leaking OSError."""
+        loop = tmp_path / "loop.py"
+        loop.symlink_to(loop)
+
+        assert validate_file_path(loop, raise_error=False) is False
+        with pytest.raises(ValidationError, match="does not exist"):
+            validate_file_path(loop)
+
+    def test_embedded_nul_treated_as_missing(self) -> None:
+        """Test that a path with a NUL byte fails instead of leaking ValueError."""
+        assert validate_file_path("bad\x00name.py", raise_error=False) is False
+
+    def test_extensions_given_as_list(self, tmp_path: Path) -> None:
+        """Test that allowed_extensions may be any sequence, not just a tuple."""
+        source = tmp_path / "contract.py"
+        source.write_text("x = 1\n")
+        extensions = [".py", ".go"]
+
+        assert validate_file_path(source, allowed_extensions=extensions) is True  # type: ignore[arg-type]
+        assert validate_file_path(
+            "contract.rs",
+            must_exist=False,
+            allowed_extensions=extensions,  # type: ignore[arg-type]
+            raise_error=False,
+        ) is False
+
+    @pytest.mark.parametrize("path", ["contract.py", "src/Contract.PY", "a.b/contract.py"])
+    def test_allowed_extension(self, path: str) -> None:
+        """Test that paths with an allowed suffix pass."""
+        assert validate_file_path(path, must_exist=False, allowed_extensions=(".py",)) is True
+        assert validate_file_path(
+            Path(path), must_exist=False, allowed_extensions=(".py",)
+        ) is True
+
+    @pytest.mark.parametrize(
+        ("path", "extensions"),
+        [
+            ("happy", ("py",)),
+            ("src/happy", ("py",)),
+            (".py", (".py",)),
+            ("src/.py", (".py",)),
+            ("contract.py.bak", (".py",)),
+            ("contract.", (".",)),
+        ],
+    )
+    def test_extension_must_start_at_dot(self, path: str, extensions: tuple[str, ...]) -> None:
+        """Test that only a real suffix, not a partial name, can match."""
+        assert validate_file_path(
+            path, must_exist=False, allowed_extensions=extensions, raise_error=False
+        ) is False
+        assert validate_file_path(
+            Path(path), must_exist=False, allowed_extensions=extensions, raise_error=False
+        ) is False
+        with pytest.raises(ValidationError, match="Invalid file extension"):
+            validate_file_path(path, must_exist=False, allowed_extensions=extensions)
+
+    def test_extension_check_on_existing_dotfile(self, tmp_path: Path) -> None:
+        """Test that an existing dotfile named like an extension fails."""
+        dotfile = tmp_path / ".py"
+        dotfile.write_text("")
+
+        assert validate_file_path(dotfile, allowed_extensions=(".py",), raise_error=False) is False
+
+
+class TestValidateRequest:
+    """Tests for validate_request."""
+
+    def test_valid_request(self) -> None:
+        """Test that a fully valid request passes."""
+        assert validate_request(
+            fork="Cancun",
+            language="python",
+            path="contract.py",
+            threshold=0.7,
+            allowed_extensions=(".py",),
+            must_exist=False,
+        ) is True
+
+    def test_single_error_raised_as_is(self) -> None:
+        """Test that one invalid field raises its own ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_request(
+                fork="cancun",
+                language="cobol",
+                path="contract.py",
+                threshold=0.7,
+                must_exist=False,
+            )
+
+        assert not isinstance(exc_info.value, SchemaValidationError)
+        assert exc_info.value.field == "language"
+
+    def test_multiple_errors_aggregated(self, tmp_path: Path) -> None:
+        """Test that several invalid fields are reported together."""
+        with pytest.raises(SchemaValidationError, match="3 fields") as exc_info:
+            validate_request(
+                fork="not-a-fork",
+                language="python",
+                path=tmp_path / "missing.py",
+                threshold=1.5,
+            )
+
+        errors = exc_info.value.validation_errors
+        assert len(errors) == 3
+        assert "not-a-fork" in errors[0]
+        assert "confidence threshold" in errors[1]
+        assert "does not exist" in errors[2]
+
+    def test_unstatable_path_reported(self, tmp_path: Path) -> None:
+        """Test that a symlink loop is reported as a validation error."""
+        loop = tmp_path / "loop.py"
+        loop.symlink_to(loop)
+
+        with pytest.raises(ValidationError, match="does not exist"):
+            validate_request(fork="cancun", language="python", path=loop, threshold=0.5)
+
+
+class TestMakeIntValidator:
+    """Tests for make_int_validator."""
+
+    @pytest.mark.parametrize(
+        ("min_value", "max_value", "value"),
+        [
+            (1, None, 0),
+            (1, None, 1),
+            (1, None, 2),
+            (0, None, -1),
+            (1, 10, 0),
+            (1, 10, 1),
+            (1, 10, 2),
+            (1, 10, 9),
+            (1, 10, 10),
+            (1, 10, 11),
+        ],
+    )
+    def test_matches_validate_positive_int(
+        self, min_value: int, max_value: int | None, value: int
+    ) -> None:
+        """Test that results and errors match validate_positive_int."""
+        validator = make_int_validator("workers", min_value=min_value, max_value=max_value)
+
+        expected = validate_positive_int(
+            value, "workers", min_value=min_value, max_value=max_value, raise_error=False
+        )
+        assert validator(value, raise_error=False) is expected
+
+        if expected:
+            assert validator(value) is True
+            return
+
+        with pytest.raises(ValidationError) as reference:
+            validate_positive_int(value, "workers", min_value=min_value, max_value=max_value)
+        with pytest.raises(ValidationError) as actual:
+            validator(value)
+
+        assert actual.value.field == reference.value.field == "workers"
+        assert actual.value.expected == reference.value.expected
+        assert actual.value.value == value
+        assert str(actual.value) == str(reference.value)